@@ -3,6 +3,12 @@ MCP Inspector Guidance Prompts - Optimized Version
 Professional guidance system with reduced redundancy
 """
 
+import sys
+from collections.abc import Iterator, Mapping
+from functools import cache, lru_cache
+from string import Formatter
+from typing import Final
+
 __all__ = [
     "inspector_workflow_guide",
     "server_testing_strategy",
@@ -11,41 +17,188 @@ __all__ = [
 ]
 
 
+# A compiled template: (literal chunk, field name or None) pairs in order
+_Segments = tuple[tuple[str, str | None], ...]
+
+
+def _compile_template(template: str) -> _Segments:
+    """
+    Compile a str.format template into literal chunks and field names
+
+    The template is parsed once, so rendering only has to interleave the
+    literal chunks with the looked-up field values. Formatter splits the
+    text at every escaped brace, so adjacent literal runs are merged back
+    into one chunk per field; only the trailing chunk has no field.
+
+    Args:
+        template: Template using plain ``{field}`` placeholders
+
+    Returns:
+        Tuple of (literal chunk, field name or None) pairs
+    """
+    segments = []
+    pending = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(f"Unsupported format spec in template field: {field}")
+        pending.append(literal)
+        if field is not None:
+            segments.append(("".join(pending), field))
+            pending.clear()
+    if pending:
+        segments.append(("".join(pending), None))
+    return tuple(segments)
+
+
+def _iter_chunks(segments: _Segments, params: Mapping[str, str]) -> Iterator[str]:
+    """Yield the literal chunks of a compiled template interleaved with values."""
+    for literal, field in segments:
+        if literal:
+            yield literal
+        if field is not None:
+            yield params[field]
+
+
+def _render(segments: _Segments, params: Mapping[str, str]) -> str:
+    """Render a compiled template into a single string."""
+    parts = []
+    for literal, field in segments:
+        parts.append(literal)
+        if field is not None:
+            parts.append(params[field])
+    return "".join(parts)
+
+
+# Sections shared by every guidance prompt, in the order they are emitted
+_SKELETON_SECTIONS: Final = (
+    "role",
+    "context",
+    "knowledge_base",
+    "input",
+    "instructions",
+    "examples",
+    "output_requirements",
+)
+
+
+def _build_skeleton(*, body_tag: str, body: str, **sections: str) -> str:
+    """
+    Assemble a prompt template from its section contents
+
+    Every guidance prompt shares the same tagged section layout, so the
+    section constants only hold their contents and the tags are added here.
+    Contents are joined into the str.format template verbatim: static
+    sections must contain no braces, and dynamic ones use plain {field}
+    placeholders.
+
+    Args:
+        body_tag: Tag wrapping the prompt-specific body
+        body: Contents of the body section
+        **sections: Contents keyed by the names in _SKELETON_SECTIONS
+
+    Returns:
+        The complete str.format template
+    """
+    parts = [f"<{name}>\n{sections[name]}\n</{name}>" for name in _SKELETON_SECTIONS]
+    parts.append(f"<{body_tag}>\n{body}\n</{body_tag}>")
+    return "\n" + "\n\n".join(parts) + "\n"
+
+
+# Documented values of every enum-like prompt argument
+_VALID: Final[dict[str, frozenset[str]]] = {
+    "server_type": frozenset(("python", "nodejs", "custom", "unknown")),
+    "testing_scope": frozenset(("basic", "comprehensive", "performance", "security")),
+    "experience_level": frozenset(("beginner", "intermediate", "expert")),
+    "server_complexity": frozenset(("simple", "medium", "complex", "enterprise")),
+    "time_constraint": frozenset(("urgent", "normal", "thorough")),
+    "focus_area": frozenset(
+        ("functionality", "performance", "security", "reliability")
+    ),
+    "error_type": frozenset(
+        ("connection", "timeout", "tool_error", "resource_error", "config_error")
+    ),
+    "server_environment": frozenset(("development", "testing", "production")),
+    "urgency_level": frozenset(("low", "normal", "high", "critical")),
+    "use_case": frozenset(
+        ("general", "ci_cd", "development", "production", "research")
+    ),
+    "team_size": frozenset(("individual", "small", "medium", "large")),
+    "automation_level": frozenset(("manual", "medium", "high")),
+}
+
+# Interned copies of the documented values, so that the lookups and cache
+# probes below can short-circuit on identity instead of comparing characters
+_INTERNED: Final[dict[str, str]] = {
+    value: sys.intern(value) for values in _VALID.values() for value in values
+}
+
+
+def _intern_arg(value: str) -> str:
+    """
+    Return the interned copy of a documented argument value
+
+    Non-string values are rendered with str(), as an f-string would.
+    """
+    if not isinstance(value, str):
+        value = str(value)
+    return _INTERNED.get(value, value)
+
+
+def _canon(name: str, value: str, default: str | None = None) -> str | None:
+    """
+    Canonicalize an argument into a lookup key
+
+    Documented values map to themselves and anything else maps to default,
+    so the lookup tables can be indexed directly. None stands for an
+    undocumented value in tables whose fallback is not a documented key.
+    """
+    return value if value in _VALID[name] else default
+
+
+_COMMANDS: Final[dict[str, str]] = {
+    "python": "python server.py",
+    "nodejs": "node server.js",
+    "custom": "Please refer to project documentation for startup command",
+    "unknown": "Need to identify server type and startup method first",
+}
+
+_STRATEGIES: Final[dict[tuple[str, str], str]] = {
+    ("basic", "beginner"): "Focus on connectivity and basic tool testing",
+    ("basic", "intermediate"): "Standard verification with error handling checks",
+    ("basic", "expert"): "Quick validation with automated reporting",
+    (
+        "comprehensive",
+        "beginner",
+    ): "Step-by-step guided testing with detailed explanations",
+    (
+        "comprehensive",
+        "intermediate",
+    ): "Full capability testing with performance monitoring",
+    ("comprehensive", "expert"): "Advanced testing with custom validation scripts",
+}
+_DEFAULT_STRATEGY: Final = "Standard comprehensive testing approach"
+
+# _STRATEGIES expanded over every canonical (scope, experience) key
+_STRATEGY_MATRIX: Final[dict[tuple[str | None, str | None], str]] = {
+    (scope, experience): _STRATEGIES.get((scope, experience), _DEFAULT_STRATEGY)
+    for scope in (*_VALID["testing_scope"], None)
+    for experience in (*_VALID["experience_level"], None)
+}
+
+
 # Common helper functions used across multiple prompts
 def _get_server_command(server_type: str) -> str:
-    """Get appropriate server command based on type."""
-    commands = {
-        "python": "python server.py",
-        "nodejs": "node server.js",
-        "custom": "Please refer to project documentation for startup command",
-        "unknown": "Need to identify server type and startup method first",
-    }
-    return commands.get(server_type, commands["unknown"])
+    """Get appropriate server command based on canonical type."""
+    return _COMMANDS[server_type]
 
 
-def _generate_testing_strategy(scope: str, experience: str) -> str:
-    """Generate testing strategy based on scope and experience."""
-    strategies = {
-        ("basic", "beginner"): "Focus on connectivity and basic tool testing",
-        ("basic", "intermediate"): "Standard verification with error handling checks",
-        ("basic", "expert"): "Quick validation with automated reporting",
-        (
-            "comprehensive",
-            "beginner",
-        ): "Step-by-step guided testing with detailed explanations",
-        (
-            "comprehensive",
-            "intermediate",
-        ): "Full capability testing with performance monitoring",
-        ("comprehensive", "expert"): "Advanced testing with custom validation scripts",
-    }
-    return strategies.get(
-        (scope, experience), "Standard comprehensive testing approach"
-    )
+def _generate_testing_strategy(scope: str | None, experience: str | None) -> str:
+    """Generate testing strategy based on canonical scope and experience."""
+    return _STRATEGY_MATRIX[(scope, experience)]
 
 
-def _get_common_recommendations(server_type: str, scope: str) -> str:
-    """Generate common recommendations based on server type and scope."""
+def _build_recommendations(server_type: str, comprehensive: bool) -> str:
+    """Build the recommendation list for a server type and scope depth."""
     base_recommendations = [
         "Establish regular testing schedule",
         "Monitor performance metrics",
@@ -57,7 +210,7 @@ def _get_common_recommendations(server_type: str, scope: str) -> str:
     elif server_type == "nodejs":
         base_recommendations.append("Verify Node.js version compatibility")
 
-    if scope == "comprehensive":
+    if comprehensive:
         base_recommendations.extend(
             [
                 "Set up continuous integration testing",
@@ -65,49 +218,44 @@ def _get_common_recommendations(server_type: str, scope: str) -> str:
             ]
         )
 
-    return "\\n".join(f"- {rec}" for rec in base_recommendations)
+    return "\n".join(f"- {rec}" for rec in base_recommendations)
 
 
-def inspector_workflow_guide(
-    server_type: str = "unknown",
-    testing_scope: str = "comprehensive",
-    experience_level: str = "intermediate",
-) -> str:
-    """
-    Generate MCP server inspection workflow guidance.
+# Only the comprehensive scope adds recommendations; every other scope gets
+# the base list. Each distinct list is rendered once at import time
+_RECOMMENDATION_LISTS: Final[dict[tuple[str, bool], str]] = {
+    (server_type, comprehensive): _build_recommendations(server_type, comprehensive)
+    for server_type in _VALID["server_type"]
+    for comprehensive in (False, True)
+}
 
-    Args:
-        server_type: Server type (python, nodejs, custom, unknown)
-        testing_scope: Testing scope (basic, comprehensive, performance, security)
-        experience_level: User experience level (beginner, intermediate, expert)
+# Every canonical (server_type, scope) pair, sharing the rendered lists above
+_RECOMMENDATIONS: Final[dict[tuple[str, str | None], str]] = {
+    (server_type, scope): _RECOMMENDATION_LISTS[(server_type, scope == "comprehensive")]
+    for server_type in _VALID["server_type"]
+    for scope in (*_VALID["testing_scope"], None)
+}
 
-    Returns:
-        str: Structured professional workflow guidance
-    """
 
-    server_command = _get_server_command(server_type)
-    testing_strategy = _generate_testing_strategy(testing_scope, experience_level)
-    recommendations = _get_common_recommendations(server_type, testing_scope)
+def _get_common_recommendations(server_type: str, scope: str | None) -> str:
+    """Generate common recommendations based on canonical server type and scope."""
+    return _RECOMMENDATIONS[(server_type, scope)]
+
 
-    return f"""
-<role>
-You are a senior MCP server testing expert, specializing in guiding AI Agents through systematic server inspection and validation.
+# Section contents of the inspector_workflow_guide template
+_WORKFLOW_ROLE = """You are a senior MCP server testing expert, specializing in guiding AI Agents through systematic server inspection and validation.
 Your professional background: Extensive experience with MCP protocol implementation, expert in various server architectures and testing methodologies
 Work approach: Professional and rigorous, focused on practical results, providing clear executable guidance
-Core responsibility: Provide AI Agents with structured testing workflows to ensure comprehensive and efficient server inspection
-</role>
+Core responsibility: Provide AI Agents with structured testing workflows to ensure comprehensive and efficient server inspection"""
 
-<context>
-Business context: Currently need to perform {testing_scope} level testing inspection on {server_type} type MCP server
+_WORKFLOW_CONTEXT_TMPL = """Business context: Currently need to perform {testing_scope} level testing inspection on {server_type} type MCP server
 Industry standards: Follow MCP (Model Context Protocol) specifications, ensure normal operation of server's three core functions: tools, resources, and prompts
 Key constraints:
 - Must ensure testing process does not affect production environment
 - Need to consider {experience_level} level user's understanding capability
-- Test results must be actionable and meaningful
-</context>
+- Test results must be actionable and meaningful"""
 
-<knowledge_base>
-Professional terminology:
+_WORKFLOW_KNOWLEDGE_BASE = """Professional terminology:
 - MCP Server: Model Context Protocol server, providing three core functions: tools, resources, and prompts
 - Inspector CLI: Official MCP testing tool, supporting 8 core inspection methods
 - Transport: Communication method, mainly including stdio and HTTP modes
@@ -120,11 +268,9 @@ Standard process:
 
 Reference materials:
 - MCP Inspector official documentation: https://modelcontextprotocol.io/legacy/tools/inspector
-- mcp-inspector-server toolkit: 11 professional testing tools
-</knowledge_base>
+- mcp-inspector-server toolkit: 11 professional testing tools"""
 
-<input>
-Input type: Testing configuration parameters
+_WORKFLOW_INPUT_TMPL = """Input type: Testing configuration parameters
 Key fields:
 - server_type: {server_type} (affects startup command and common issue identification)
 - testing_scope: {testing_scope} (determines testing depth and coverage)
@@ -133,11 +279,9 @@ Key fields:
 Current input configuration:
 Server type: {server_type}
 Testing scope: {testing_scope}
-Experience level: {experience_level}
-</input>
+Experience level: {experience_level}"""
 
-<instructions>
-Please generate structured testing workflow guidance following these steps:
+_WORKFLOW_INSTRUCTIONS = """Please generate structured testing workflow guidance following these steps:
 
 1. **Environment Preparation Phase**
    - Determine startup command and dependency checks based on server type
@@ -162,11 +306,9 @@ Please generate structured testing workflow guidance following these steps:
 5. **Quality Assessment Phase**
    - Generate comprehensive test reports
    - Provide improvement recommendations and best practices
-   - Determine next action plans
-</instructions>
+   - Determine next action plans"""
 
-<examples>
-**Example 1 - Python Server Basic Testing**
+_WORKFLOW_EXAMPLES = """**Example 1 - Python Server Basic Testing**
 Input: server_type="python", testing_scope="basic", experience_level="beginner"
 Output:
 ```
@@ -197,11 +339,9 @@ Advanced testing strategy:
 - Performance benchmarking: comprehensive_server_test() detailed analysis
 - Security audit: Input validation and permission control checks
 - Monitoring integration: set_logging_level() debug mode analysis
-```
-</examples>
+```"""
 
-<output_requirements>
-Quality standards:
+_WORKFLOW_OUTPUT_REQUIREMENTS = """Quality standards:
 - Provide complete step-by-step guidance ensuring AI Agent can execute independently
 - Include specific command examples and expected results
 - Provide appropriate technical depth for different experience levels
@@ -217,11 +357,9 @@ Self-check list:
 □ Does it cover the complete testing process
 □ Does it provide specific executable commands
 □ Does it consider different experience level needs
-□ Does it include quality assessment and improvement recommendations
-</output_requirements>
+□ Does it include quality assessment and improvement recommendations"""
 
-<workflow_guide>
-# 🎯 MCP Server Inspection Workflow Guide
+_WORKFLOW_BODY_TMPL = """# 🎯 MCP Server Inspection Workflow Guide
 
 ## 📋 Testing Configuration
 - **Target server**: {server_type} type
@@ -315,49 +453,153 @@ elif "{testing_scope}" == "comprehensive":
 - ❌ Serious issues: Need architecture-level inspection and fixes
 
 ---
-*Professional testing guidance generated based on Anthropic's 6-layer golden structure framework*
-</workflow_guide>
-"""
+*Professional testing guidance generated based on Anthropic's 6-layer golden structure framework*"""
+
+_WORKFLOW_TMPL = _build_skeleton(
+    role=_WORKFLOW_ROLE,
+    context=_WORKFLOW_CONTEXT_TMPL,
+    knowledge_base=_WORKFLOW_KNOWLEDGE_BASE,
+    input=_WORKFLOW_INPUT_TMPL,
+    instructions=_WORKFLOW_INSTRUCTIONS,
+    examples=_WORKFLOW_EXAMPLES,
+    output_requirements=_WORKFLOW_OUTPUT_REQUIREMENTS,
+    body_tag="workflow_guide",
+    body=_WORKFLOW_BODY_TMPL,
+)
 
 
-def server_testing_strategy(
-    server_complexity: str = "medium",
-    time_constraint: str = "normal",
-    focus_area: str = "functionality",
+@cache
+def _workflow_guide_template() -> _Segments:
+    """Compile the inspector_workflow_guide template on first use."""
+    return _compile_template(_WORKFLOW_TMPL)
+
+
+def inspector_workflow_guide(
+    server_type: str = "unknown",
+    testing_scope: str = "comprehensive",
+    experience_level: str = "intermediate",
 ) -> str:
     """
-    Generate MCP server testing strategy.
+    Generate MCP server inspection workflow guidance.
 
     Args:
-        server_complexity: Server complexity (simple, medium, complex, enterprise)
-        time_constraint: Time constraint (urgent, normal, thorough)
-        focus_area: Focus area (functionality, performance, security, reliability)
+        server_type: Server type (python, nodejs, custom, unknown)
+        testing_scope: Testing scope (basic, comprehensive, performance, security)
+        experience_level: User experience level (beginner, intermediate, expert)
 
     Returns:
-        str: Structured professional testing strategy
+        str: Structured professional workflow guidance
+    """
+    return _build_workflow_guide(
+        _intern_arg(server_type),
+        _intern_arg(testing_scope),
+        _intern_arg(experience_level),
+    )
+
+
+def inspector_workflow_guide_chunks(
+    server_type: str = "unknown",
+    testing_scope: str = "comprehensive",
+    experience_level: str = "intermediate",
+) -> Iterator[str]:
     """
+    Generate MCP server inspection workflow guidance as a stream of chunks.
+
+    Same content and arguments as inspector_workflow_guide, but yielded in
+    pieces that reference the shared template constants, so transports can
+    write them out without first building one large string. This is a
+    Python-level helper and is not exported as an MCP prompt.
 
-    return f"""
-<role>
-You are a professional MCP server testing strategist, responsible for developing optimal testing plans for servers of different complexity and requirements.
+    Returns:
+        Iterator[str]: Chunks that concatenate to the workflow guidance
+    """
+    return _iter_chunks(
+        _workflow_guide_template(),
+        _workflow_guide_params(
+            _intern_arg(server_type),
+            _intern_arg(testing_scope),
+            _intern_arg(experience_level),
+        ),
+    )
+
+
+def inspector_workflow_guide_bytes(
+    server_type: str = "unknown",
+    testing_scope: str = "comprehensive",
+    experience_level: str = "intermediate",
+) -> bytes:
+    """
+    Generate MCP server inspection workflow guidance as UTF-8 bytes.
+
+    Same content and arguments as inspector_workflow_guide, for transports
+    that write UTF-8 directly. The encoded guidance is cached alongside the
+    rendered string, so repeated calls skip the transcode. This is a
+    Python-level helper and is not exported as an MCP prompt.
+
+    Returns:
+        bytes: UTF-8 encoded workflow guidance
+    """
+    return _build_workflow_guide_bytes(
+        _intern_arg(server_type),
+        _intern_arg(testing_scope),
+        _intern_arg(experience_level),
+    )
+
+
+@lru_cache(maxsize=128)
+def _build_workflow_guide_bytes(
+    server_type: str, testing_scope: str, experience_level: str
+) -> bytes:
+    """Encode workflow guidance once per argument combination."""
+    return _build_workflow_guide(server_type, testing_scope, experience_level).encode(
+        "utf-8"
+    )
+
+
+@lru_cache(maxsize=128)
+def _build_workflow_guide(
+    server_type: str, testing_scope: str, experience_level: str
+) -> str:
+    """Render workflow guidance; the output depends only on the arguments."""
+    return _render(
+        _workflow_guide_template(),
+        _workflow_guide_params(server_type, testing_scope, experience_level),
+    )
+
+
+def _workflow_guide_params(
+    server_type: str, testing_scope: str, experience_level: str
+) -> dict[str, str]:
+    """Resolve the field values of the workflow guide template."""
+    server_key = _canon("server_type", server_type, "unknown")
+    scope_key = _canon("testing_scope", testing_scope)
+    experience_key = _canon("experience_level", experience_level)
+    return {
+        "server_type": server_type,
+        "testing_scope": testing_scope,
+        "experience_level": experience_level,
+        "server_command": _get_server_command(server_key),
+        "testing_strategy": _generate_testing_strategy(scope_key, experience_key),
+        "recommendations": _get_common_recommendations(server_key, scope_key),
+    }
+
+
+# Section contents of the server_testing_strategy template
+_TESTING_STRATEGY_ROLE = """You are a professional MCP server testing strategist, responsible for developing optimal testing plans for servers of different complexity and requirements.
 Your professional background: Deep theoretical foundation in software testing and rich practical experience in MCP protocol testing
 Work approach: Systematic thinking, focus on balancing efficiency and quality, provide executable strategic solutions
-Core responsibility: Design the most suitable testing strategies and execution plans based on project constraints and business requirements
-</role>
+Core responsibility: Design the most suitable testing strategies and execution plans based on project constraints and business requirements"""
 
-<context>
-Business context: Need to develop testing strategy for {server_complexity} complexity MCP server
+_TESTING_STRATEGY_CONTEXT_TMPL = """Business context: Need to develop testing strategy for {server_complexity} complexity MCP server
 Time constraint: {time_constraint} level time limitation
 Focus area: {focus_area} aspect quality assurance
 Industry standards: Follow software testing best practices, ensure MCP protocol compliance
 Key constraints:
 - Must complete effective testing within time limits
 - Testing coverage must match server complexity
-- Focus on specified quality dimensions
-</context>
+- Focus on specified quality dimensions"""
 
-<knowledge_base>
-Professional terminology:
+_TESTING_STRATEGY_KNOWLEDGE_BASE = """Professional terminology:
 - Test Pyramid: Unit testing → Integration testing → End-to-end testing layered strategy
 - Risk-driven Testing: Prioritize testing high-risk areas based on risk assessment
 - Shift Left Testing: Introduce testing activities early in development
@@ -373,11 +615,9 @@ Complexity classification:
 Time constraint strategies:
 - Urgent: Critical path priority, quick verification of core functions
 - Normal: Balance coverage and efficiency, standard testing process
-- Thorough: Comprehensive deep testing, detailed analysis and documentation
-</knowledge_base>
+- Thorough: Comprehensive deep testing, detailed analysis and documentation"""
 
-<input>
-Input type: Testing strategy configuration parameters
+_TESTING_STRATEGY_INPUT_TMPL = """Input type: Testing strategy configuration parameters
 Key fields:
 - server_complexity: {server_complexity} (determines testing depth and tool selection)
 - time_constraint: {time_constraint} (affects testing scope and execution method)
@@ -386,11 +626,9 @@ Key fields:
 Current strategy configuration:
 Server complexity: {server_complexity}
 Time constraint: {time_constraint}
-Focus area: {focus_area}
-</input>
+Focus area: {focus_area}"""
 
-<instructions>
-Please develop structured testing strategy following these steps:
+_TESTING_STRATEGY_INSTRUCTIONS = """Please develop structured testing strategy following these steps:
 
 1. **Strategy Analysis Phase**
    - Assess testing requirements corresponding to server complexity
@@ -415,11 +653,9 @@ Please develop structured testing strategy following these steps:
 5. **Continuous Improvement Phase**
    - Collect testing execution feedback
    - Optimize testing strategies and tool usage
-   - Establish knowledge accumulation and experience transfer mechanisms
-</instructions>
+   - Establish knowledge accumulation and experience transfer mechanisms"""
 
-<examples>
-**Example 1 - Simple Server Quick Testing**
+_TESTING_STRATEGY_EXAMPLES = """**Example 1 - Simple Server Quick Testing**
 Input: server_complexity="simple", time_constraint="urgent", focus_area="functionality"
 Output:
 ```
@@ -441,11 +677,9 @@ Comprehensive strategy: 4-hour deep security audit
 - Tool matrix: Complete set of 11 inspector tools + security-specific testing
 - Testing focus: Input validation + permission control + data protection
 - Success criteria: Zero security vulnerabilities + complete compliance report
-```
-</examples>
+```"""
 
-<output_requirements>
-Quality standards:
+_TESTING_STRATEGY_OUTPUT_REQUIREMENTS = """Quality standards:
 - Strategy must highly match input parameters
 - Provide specific executable testing steps
 - Include clear time estimates and resource requirements
@@ -461,11 +695,9 @@ Self-check list:
 □ Does it fully consider complexity requirements
 □ Does it reasonably arrange time constraints
 □ Does it highlight focus areas
-□ Does it provide actionable execution plans
-</output_requirements>
+□ Does it provide actionable execution plans"""
 
-<testing_strategy>
-# 🎯 MCP Server Testing Strategy
+_TESTING_STRATEGY_BODY_TMPL = """# 🎯 MCP Server Testing Strategy
 
 ## 📋 Strategy Overview
 - **Target complexity**: {server_complexity} level server
@@ -475,24 +707,24 @@ Self-check list:
 ## 🔍 Strategy Analysis
 
 ### Complexity Assessment
-{_get_complexity_description(server_complexity)}
+{complexity_description}
 
 ### Time Constraint Impact
-{_get_time_impact_description(time_constraint)}
+{time_impact_description}
 
 ### Focus Area Strategy
-{_get_focus_strategy_description(focus_area)}
+{focus_strategy_description}
 
 ## 🛠️ Tool Selection Matrix
 
 ### Core Testing Tools
-{_get_core_tools_description(server_complexity, focus_area)}
+{core_tools_description}
 
 ### Specialized Testing Tools
-{_get_specialized_tools_description(focus_area)}
+{specialized_tools_description}
 
 ### Auxiliary Analysis Tools
-{_get_auxiliary_tools_description(server_complexity)}
+{auxiliary_tools_description}
 
 ## 📊 Execution Plan
 
@@ -582,107 +814,200 @@ else:
 - Comprehensive testing: Adjusted based on complexity
 
 ---
-*Professional testing strategy based on Anthropic's 6-layer golden structure framework*
-</testing_strategy>
-"""
+*Professional testing strategy based on Anthropic's 6-layer golden structure framework*"""
+
+_TESTING_STRATEGY_TMPL = _build_skeleton(
+    role=_TESTING_STRATEGY_ROLE,
+    context=_TESTING_STRATEGY_CONTEXT_TMPL,
+    knowledge_base=_TESTING_STRATEGY_KNOWLEDGE_BASE,
+    input=_TESTING_STRATEGY_INPUT_TMPL,
+    instructions=_TESTING_STRATEGY_INSTRUCTIONS,
+    examples=_TESTING_STRATEGY_EXAMPLES,
+    output_requirements=_TESTING_STRATEGY_OUTPUT_REQUIREMENTS,
+    body_tag="testing_strategy",
+    body=_TESTING_STRATEGY_BODY_TMPL,
+)
+
 
+@cache
+def _testing_strategy_template() -> _Segments:
+    """Compile the server_testing_strategy template on first use."""
+    return _compile_template(_TESTING_STRATEGY_TMPL)
 
-def _get_complexity_description(complexity: str) -> str:
+
+def server_testing_strategy(
+    server_complexity: str = "medium",
+    time_constraint: str = "normal",
+    focus_area: str = "functionality",
+) -> str:
+    """
+    Generate MCP server testing strategy.
+
+    Args:
+        server_complexity: Server complexity (simple, medium, complex, enterprise)
+        time_constraint: Time constraint (urgent, normal, thorough)
+        focus_area: Focus area (functionality, performance, security, reliability)
+
+    Returns:
+        str: Structured professional testing strategy
+    """
+    return _build_testing_strategy(
+        _intern_arg(server_complexity),
+        _intern_arg(time_constraint),
+        _intern_arg(focus_area),
+    )
+
+
+@lru_cache(maxsize=128)
+def _build_testing_strategy(
+    server_complexity: str, time_constraint: str, focus_area: str
+) -> str:
+    """Render testing strategy; the output depends only on the arguments."""
+    fragments = _STRATEGY_FRAGMENTS[
+        (
+            _canon("server_complexity", server_complexity),
+            _canon("time_constraint", time_constraint, "normal"),
+            _canon("focus_area", focus_area, "functionality"),
+        )
+    ]
+    return _render(
+        _testing_strategy_template(),
+        {
+            "server_complexity": server_complexity,
+            "time_constraint": time_constraint,
+            "focus_area": focus_area,
+            **fragments,
+        },
+    )
+
+
+_MEDIUM_COMPLEXITY = (
+    "Multi-functional module server, need to balance testing coverage and efficiency"
+)
+_COMPLEXITY_DESCRIPTIONS: Final[dict[str | None, str]] = {
+    "simple": "Single responsibility server, focus on core functionality completeness verification",
+    "medium": _MEDIUM_COMPLEXITY,
+    "complex": "Highly integrated server, need deep testing and dependency relationship verification",
+    "enterprise": "Enterprise-level server, need comprehensive quality assurance and compliance verification",
+    None: _MEDIUM_COMPLEXITY,
+}
+
+
+def _get_complexity_description(complexity: str | None) -> str:
     """Get complexity description"""
-    descriptions = {
-        "simple": "Single responsibility server, focus on core functionality completeness verification",
-        "medium": "Multi-functional module server, need to balance testing coverage and efficiency",
-        "complex": "Highly integrated server, need deep testing and dependency relationship verification",
-        "enterprise": "Enterprise-level server, need comprehensive quality assurance and compliance verification",
-    }
-    return descriptions.get(complexity, descriptions["medium"])
+    return _COMPLEXITY_DESCRIPTIONS[complexity]
+
+
+_TIME_IMPACTS: Final[dict[str, str]] = {
+    "urgent": "Prioritize critical paths, quickly identify key issues",
+    "normal": "Standard testing process, balance speed and coverage",
+    "thorough": "Deep comprehensive testing, detailed analysis and documentation",
+}
 
 
 def _get_time_impact_description(constraint: str) -> str:
     """Get time constraint impact description"""
-    impacts = {
-        "urgent": "Prioritize critical paths, quickly identify key issues",
-        "normal": "Standard testing process, balance speed and coverage",
-        "thorough": "Deep comprehensive testing, detailed analysis and documentation",
-    }
-    return impacts.get(constraint, impacts["normal"])
+    return _TIME_IMPACTS[constraint]
+
+
+_FOCUS_STRATEGIES: Final[dict[str, str]] = {
+    "functionality": "Focus on verifying tools, resources, and prompts three core functions",
+    "performance": "Focus on response time, concurrent capability, resource usage efficiency",
+    "security": "Strengthen input validation, permission control, data protection testing",
+    "reliability": "Test stability, error recovery, boundary condition handling",
+}
 
 
 def _get_focus_strategy_description(area: str) -> str:
     """Get focus area strategy description"""
-    strategies = {
-        "functionality": "Focus on verifying tools, resources, and prompts three core functions",
-        "performance": "Focus on response time, concurrent capability, resource usage efficiency",
-        "security": "Strengthen input validation, permission control, data protection testing",
-        "reliability": "Test stability, error recovery, boundary condition handling",
-    }
-    return strategies.get(area, strategies["functionality"])
+    return _FOCUS_STRATEGIES[area]
+
+
+_BASIC_CORE_TOOLS = "- inspect_mcp_server\n- comprehensive_server_test\n- call_mcp_tool"
+_FULL_CORE_TOOLS = "- Complete set of 11 inspector tools\n- batch_inspect_servers\n- create_inspector_config"
+_CORE_TOOLS: Final[dict[str | None, str]] = {
+    "simple": _BASIC_CORE_TOOLS,
+    "medium": _BASIC_CORE_TOOLS,
+    "complex": _FULL_CORE_TOOLS,
+    "enterprise": _FULL_CORE_TOOLS,
+    None: _FULL_CORE_TOOLS,
+}
 
 
-def _get_core_tools_description(complexity: str, focus: str) -> str:
+def _get_core_tools_description(complexity: str | None, focus: str) -> str:
     """Get core tools description"""
-    if complexity in ["simple", "medium"]:
-        return "- inspect_mcp_server\\n- comprehensive_server_test\\n- call_mcp_tool"
-    else:
-        return "- Complete set of 11 inspector tools\\n- batch_inspect_servers\\n- create_inspector_config"
+    return _CORE_TOOLS[complexity]
+
+
+_SPECIALIZED_TOOLS: Final[dict[str, str]] = {
+    "functionality": "- read_mcp_resource\n- get_mcp_prompt\n- list_resource_templates",
+    "performance": "- comprehensive_server_test (performance mode)\n- set_logging_level (debug analysis)",
+    "security": "- Input validation testing tools\n- Permission control checking tools",
+    "reliability": "- Long-running testing\n- Error recovery verification tools",
+}
 
 
 def _get_specialized_tools_description(focus: str) -> str:
     """Get specialized tools description"""
-    tools = {
-        "functionality": "- read_mcp_resource\\n- get_mcp_prompt\\n- list_resource_templates",
-        "performance": "- comprehensive_server_test (performance mode)\\n- set_logging_level (debug analysis)",
-        "security": "- Input validation testing tools\\n- Permission control checking tools",
-        "reliability": "- Long-running testing\\n- Error recovery verification tools",
-    }
-    return tools.get(focus, tools["functionality"])
+    return _SPECIALIZED_TOOLS[focus]
 
 
-def _get_auxiliary_tools_description(complexity: str) -> str:
-    """Get auxiliary tools description"""
-    if complexity in ["complex", "enterprise"]:
-        return "- get_inspector_help\\n- inspect_with_config\\n- Custom testing scripts"
-    else:
-        return "- get_inspector_help\\n- Basic log analysis tools"
+_BASIC_AUXILIARY_TOOLS = "- get_inspector_help\n- Basic log analysis tools"
+_FULL_AUXILIARY_TOOLS = (
+    "- get_inspector_help\n- inspect_with_config\n- Custom testing scripts"
+)
+_AUXILIARY_TOOLS: Final[dict[str | None, str]] = {
+    "simple": _BASIC_AUXILIARY_TOOLS,
+    "medium": _BASIC_AUXILIARY_TOOLS,
+    "complex": _FULL_AUXILIARY_TOOLS,
+    "enterprise": _FULL_AUXILIARY_TOOLS,
+    None: _BASIC_AUXILIARY_TOOLS,
+}
 
 
-def troubleshooting_guide(
-    error_type: str = "connection",
-    server_environment: str = "development",
-    urgency_level: str = "normal",
-) -> str:
-    """
-    Generate MCP server troubleshooting guidance.
+def _get_auxiliary_tools_description(complexity: str | None) -> str:
+    """Get auxiliary tools description"""
+    return _AUXILIARY_TOOLS[complexity]
+
+
+def _strategy_fragments(
+    complexity: str | None, constraint: str, focus: str
+) -> dict[str, str]:
+    """Resolve the derived fields of the testing strategy template."""
+    return {
+        "complexity_description": _get_complexity_description(complexity),
+        "time_impact_description": _get_time_impact_description(constraint),
+        "focus_strategy_description": _get_focus_strategy_description(focus),
+        "core_tools_description": _get_core_tools_description(complexity, focus),
+        "specialized_tools_description": _get_specialized_tools_description(focus),
+        "auxiliary_tools_description": _get_auxiliary_tools_description(complexity),
+    }
 
-    Args:
-        error_type: Error type (connection, timeout, tool_error, resource_error, config_error)
-        server_environment: Server environment (development, testing, production)
-        urgency_level: Urgency level (low, normal, high, critical)
 
-    Returns:
-        str: Structured professional troubleshooting guidance
-    """
+# Derived fields for every canonical (complexity, constraint, focus) triple
+_STRATEGY_FRAGMENTS: Final[dict[tuple[str | None, str, str], dict[str, str]]] = {
+    (complexity, constraint, focus): _strategy_fragments(complexity, constraint, focus)
+    for complexity in (*_VALID["server_complexity"], None)
+    for constraint in _VALID["time_constraint"]
+    for focus in _VALID["focus_area"]
+}
+
 
-    return f"""
-<role>
-You are an experienced MCP server troubleshooting expert, specializing in rapid diagnosis and resolution of various server issues.
+# Section contents of the troubleshooting_guide template
+_TROUBLESHOOTING_ROLE = """You are an experienced MCP server troubleshooting expert, specializing in rapid diagnosis and resolution of various server issues.
 Your professional background: Years of distributed system fault diagnosis experience, expert in various MCP protocol exception scenarios
 Work approach: Calm and professional, quick response, provide systematic solutions
-Core responsibility: Help users quickly locate problem root causes, provide executable repair steps and preventive measures
-</role>
+Core responsibility: Help users quickly locate problem root causes, provide executable repair steps and preventive measures"""
 
-<context>
-Business context: {error_type} type fault occurred in {server_environment} environment
+_TROUBLESHOOTING_CONTEXT_TMPL = """Business context: {error_type} type fault occurred in {server_environment} environment
 Urgency level: {urgency_level} level, requiring corresponding response speed
 Industry standards: Follow ITIL fault management processes, ensure quick problem resolution and knowledge accumulation
 Key constraints:
 - Must provide solutions within urgency level required timeframe
 - Solutions must suit current environment's risk tolerance
-- Need to provide preventive measures to avoid problem recurrence
-</context>
+- Need to provide preventive measures to avoid problem recurrence"""
 
-<knowledge_base>
-Professional terminology:
+_TROUBLESHOOTING_KNOWLEDGE_BASE = """Professional terminology:
 - RCA (Root Cause Analysis): Systematic approach to find fundamental causes of problems
 - MTTR (Mean Time To Recovery): Average recovery time, measuring fault handling efficiency
 - Circuit Breaker: Circuit breaker pattern, preventing fault propagation protection mechanism
@@ -699,11 +1024,9 @@ Common error classifications:
 Environment risk levels:
 - Development: Low risk, can perform experimental fixes
 - Testing: Medium risk, need to record repair process
-- Production: High risk, prioritize service stability
-</knowledge_base>
+- Production: High risk, prioritize service stability"""
 
-<input>
-Input type: Fault diagnosis parameters
+_TROUBLESHOOTING_INPUT_TMPL = """Input type: Fault diagnosis parameters
 Key fields:
 - error_type: {error_type} (determines diagnosis focus and solution strategy)
 - server_environment: {server_environment} (affects repair plan risk control)
@@ -712,11 +1035,9 @@ Key fields:
 Current fault situation:
 Error type: {error_type}
 Environment: {server_environment}
-Urgency level: {urgency_level}
-</input>
+Urgency level: {urgency_level}"""
 
-<instructions>
-Please provide structured troubleshooting guidance following these steps:
+_TROUBLESHOOTING_INSTRUCTIONS = """Please provide structured troubleshooting guidance following these steps:
 
 1. **Problem Identification Phase**
    - Quickly identify fault symptoms and impact scope
@@ -741,11 +1062,9 @@ Please provide structured troubleshooting guidance following these steps:
 5. **Prevention and Improvement Phase**
    - Analyze deep causes of problem occurrence
    - Establish preventive measures and monitoring mechanisms
-   - Update documentation and knowledge base
-</instructions>
+   - Update documentation and knowledge base"""
 
-<examples>
-**Example 1 - Development Environment Connection Issue**
+_TROUBLESHOOTING_EXAMPLES = """**Example 1 - Development Environment Connection Issue**
 Input: error_type="connection", server_environment="development", urgency_level="normal"
 Output:
 ```
@@ -774,11 +1093,9 @@ Emergency response:
 - Isolate faulty tool to prevent impact spread
 - Collect detailed error logs for analysis
 - Notify relevant teams and users
-```
-</examples>
+```"""
 
-<output_requirements>
-Quality standards:
+_TROUBLESHOOTING_OUTPUT_REQUIREMENTS = """Quality standards:
 - Provide quick and effective problem solutions
 - Include specific diagnostic commands and repair steps
 - Consider environment risks and provide appropriate safety measures
@@ -794,28 +1111,26 @@ Self-check list:
 □ Does it accurately identify the problem type
 □ Does it provide executable solution steps
 □ Does it consider environment risk factors
-□ Does it include verification and prevention measures
-</output_requirements>
+□ Does it include verification and prevention measures"""
 
-<troubleshooting_solution>
-# 🚨 MCP Server Troubleshooting Guide
+_TROUBLESHOOTING_BODY_TMPL = """# 🚨 MCP Server Troubleshooting Guide
 
 ## 📋 Fault Overview
 - **Error type**: {error_type}
 - **Environment**: {server_environment}
 - **Urgency level**: {urgency_level}
-- **Response strategy**: {_get_response_strategy(urgency_level)}
+- **Response strategy**: {response_strategy}
 
 ## 🔍 Problem Diagnosis
 
 ### Symptom Identification
-{_get_error_symptoms(error_type)}
+{error_symptoms}
 
 ### Possible Causes
-{_get_possible_causes(error_type)}
+{possible_causes}
 
 ### Impact Assessment
-{_get_impact_assessment(error_type, server_environment)}
+{impact_assessment}
 
 ## 🛠️ Solution
 
@@ -853,7 +1168,7 @@ else:
 ```
 
 ### Specialized Repair (15-30 minutes)
-{_get_specific_fix_steps(error_type, server_environment)}
+{specific_fix_steps}
 
 ## ✅ Verification Testing
 
@@ -889,16 +1204,16 @@ else:
 
 ## 🔒 Environment Security Considerations
 
-### {server_environment.title()} Environment Special Requirements
-{_get_environment_considerations(server_environment)}
+### {environment_title} Environment Special Requirements
+{environment_considerations}
 
 ## 🚨 Emergency Plans
 
 ### Rollback Plan
-{_get_rollback_plan(error_type, server_environment)}
+{rollback_plan}
 
 ### Escalation Path
-{_get_escalation_path(urgency_level)}
+{escalation_path}
 
 ## 📊 Preventive Measures
 
@@ -908,72 +1223,143 @@ else:
 - Regularly execute health check scripts
 
 ### Improvement Recommendations
-{_get_improvement_suggestions(error_type)}
+{improvement_suggestions}
 
 ---
-*Professional troubleshooting guidance based on Anthropic's 6-layer golden structure framework*
-</troubleshooting_solution>
-"""
+*Professional troubleshooting guidance based on Anthropic's 6-layer golden structure framework*"""
+
+_TROUBLESHOOTING_TMPL = _build_skeleton(
+    role=_TROUBLESHOOTING_ROLE,
+    context=_TROUBLESHOOTING_CONTEXT_TMPL,
+    knowledge_base=_TROUBLESHOOTING_KNOWLEDGE_BASE,
+    input=_TROUBLESHOOTING_INPUT_TMPL,
+    instructions=_TROUBLESHOOTING_INSTRUCTIONS,
+    examples=_TROUBLESHOOTING_EXAMPLES,
+    output_requirements=_TROUBLESHOOTING_OUTPUT_REQUIREMENTS,
+    body_tag="troubleshooting_solution",
+    body=_TROUBLESHOOTING_BODY_TMPL,
+)
+
+
+@cache
+def _troubleshooting_guide_template() -> _Segments:
+    """Compile the troubleshooting_guide template on first use."""
+    return _compile_template(_TROUBLESHOOTING_TMPL)
+
+
+def troubleshooting_guide(
+    error_type: str = "connection",
+    server_environment: str = "development",
+    urgency_level: str = "normal",
+) -> str:
+    """
+    Generate MCP server troubleshooting guidance.
+
+    Args:
+        error_type: Error type (connection, timeout, tool_error, resource_error, config_error)
+        server_environment: Server environment (development, testing, production)
+        urgency_level: Urgency level (low, normal, high, critical)
+
+    Returns:
+        str: Structured professional troubleshooting guidance
+    """
+    return _build_troubleshooting_guide(
+        _intern_arg(error_type),
+        _intern_arg(server_environment),
+        _intern_arg(urgency_level),
+    )
+
+
+@lru_cache(maxsize=128)
+def _build_troubleshooting_guide(
+    error_type: str, server_environment: str, urgency_level: str
+) -> str:
+    """Render troubleshooting guidance; the output depends only on the arguments."""
+    fragments = _TROUBLESHOOTING_FRAGMENTS[
+        (
+            _canon("error_type", error_type),
+            _canon("server_environment", server_environment),
+            _canon("urgency_level", urgency_level, "normal"),
+        )
+    ]
+    return _render(
+        _troubleshooting_guide_template(),
+        {
+            "error_type": error_type,
+            "server_environment": server_environment,
+            "urgency_level": urgency_level,
+            "environment_title": server_environment.title(),
+            **fragments,
+        },
+    )
+
+
+_RESPONSE_STRATEGIES: Final[dict[str, str]] = {
+    "low": "Standard process handling, focus on thorough resolution",
+    "normal": "Balance speed and quality, ensure effective resolution",
+    "high": "Quick response, prioritize service recovery",
+    "critical": "Emergency handling, take immediate action",
+}
+_DEFAULT_RESPONSE_STRATEGY: Final = _RESPONSE_STRATEGIES["normal"]
 
 
 def _get_response_strategy(urgency: str) -> str:
     """Get response strategy based on urgency level"""
-    strategies = {
-        "low": "Standard process handling, focus on thorough resolution",
-        "normal": "Balance speed and quality, ensure effective resolution",
-        "high": "Quick response, prioritize service recovery",
-        "critical": "Emergency handling, take immediate action",
-    }
-    return strategies.get(urgency, strategies["normal"])
+    return _RESPONSE_STRATEGIES.get(urgency, _DEFAULT_RESPONSE_STRATEGY)
+
+
+_ERROR_SYMPTOMS: Final[dict[str, str]] = {
+    "connection": "- Unable to connect to server\n- Connection timeout or refused\n- Handshake failure",
+    "timeout": "- Slow request response\n- Operation timeout failure\n- Partial functions unresponsive",
+    "tool_error": "- Tool call failure\n- Parameter validation error\n- Execution exception interruption",
+    "resource_error": "- Resource inaccessible\n- File read failure\n- Content format error",
+    "config_error": "- Service startup failure\n- Configuration loading error\n- Parameter validation failure",
+}
+_DEFAULT_ERROR_SYMPTOMS: Final = _ERROR_SYMPTOMS["connection"]
 
 
-def _get_error_symptoms(error_type: str) -> str:
+def _get_error_symptoms(error_type: str | None) -> str:
     """Get symptom description based on error type"""
-    symptoms = {
-        "connection": "- Unable to connect to server\\n- Connection timeout or refused\\n- Handshake failure",
-        "timeout": "- Slow request response\\n- Operation timeout failure\\n- Partial functions unresponsive",
-        "tool_error": "- Tool call failure\\n- Parameter validation error\\n- Execution exception interruption",
-        "resource_error": "- Resource inaccessible\\n- File read failure\\n- Content format error",
-        "config_error": "- Service startup failure\\n- Configuration loading error\\n- Parameter validation failure",
-    }
-    return symptoms.get(error_type, symptoms["connection"])
+    return _ERROR_SYMPTOMS.get(error_type, _DEFAULT_ERROR_SYMPTOMS)
+
+
+_POSSIBLE_CAUSES: Final[dict[str, str]] = {
+    "connection": "- Server not started or crashed\n- Port occupied or firewall blocked\n- Network connection issues",
+    "timeout": "- Server overloaded\n- Resource shortage or deadlock\n- Network delay too high",
+    "tool_error": "- Tool implementation defects\n- Incorrect parameter format\n- Insufficient permissions",
+    "resource_error": "- Incorrect file path\n- Permission setting issues\n- Unsupported resource format",
+    "config_error": "- Configuration file syntax error\n- Missing required parameters\n- Environment variables not set",
+}
+_DEFAULT_POSSIBLE_CAUSES: Final = _POSSIBLE_CAUSES["connection"]
 
 
-def _get_possible_causes(error_type: str) -> str:
+def _get_possible_causes(error_type: str | None) -> str:
     """Get possible causes based on error type"""
-    causes = {
-        "connection": "- Server not started or crashed\\n- Port occupied or firewall blocked\\n- Network connection issues",
-        "timeout": "- Server overloaded\\n- Resource shortage or deadlock\\n- Network delay too high",
-        "tool_error": "- Tool implementation defects\\n- Incorrect parameter format\\n- Insufficient permissions",
-        "resource_error": "- Incorrect file path\\n- Permission setting issues\\n- Unsupported resource format",
-        "config_error": "- Configuration file syntax error\\n- Missing required parameters\\n- Environment variables not set",
-    }
-    return causes.get(error_type, causes["connection"])
+    return _POSSIBLE_CAUSES.get(error_type, _DEFAULT_POSSIBLE_CAUSES)
 
 
-def _get_impact_assessment(error_type: str, environment: str) -> str:
-    """Assess error impact"""
-    base_impact = {
-        "connection": "Service completely unavailable",
-        "timeout": "Service performance severely degraded",
-        "tool_error": "Partial functions unavailable",
-        "resource_error": "Information access limited",
-        "config_error": "Service cannot start normally",
-    }
+_BASE_IMPACTS: Final[dict[str, str]] = {
+    "connection": "Service completely unavailable",
+    "timeout": "Service performance severely degraded",
+    "tool_error": "Partial functions unavailable",
+    "resource_error": "Information access limited",
+    "config_error": "Service cannot start normally",
+}
 
-    env_multiplier = {
-        "development": "affects development efficiency",
-        "testing": "affects testing progress",
-        "production": "affects business operations",
-    }
+_ENVIRONMENT_IMPACTS: Final[dict[str, str]] = {
+    "development": "affects development efficiency",
+    "testing": "affects testing progress",
+    "production": "affects business operations",
+}
 
-    return f"{base_impact.get(error_type, 'Unknown impact')}, {env_multiplier.get(environment, 'unknown impact')}"
 
+def _get_impact_assessment(error_type: str | None, environment: str | None) -> str:
+    """Assess error impact"""
+    return f"{_BASE_IMPACTS.get(error_type, 'Unknown impact')}, {_ENVIRONMENT_IMPACTS.get(environment, 'unknown impact')}"
 
-def _get_specific_fix_steps(error_type: str, environment: str) -> str:
-    """Get specific fix steps based on error type and environment"""
-    fixes = {
-        "connection": """
+
+_FIX_STEPS: Final[dict[str, str]] = {
+    "connection": """
 ```bash
 # Check server process
 ps aux | grep server.py
@@ -987,7 +1373,7 @@ python server.py &
 # Verify connection
 inspect_mcp_server("python server.py", "tools/list")
 ```""",
-        "timeout": """
+    "timeout": """
 ```python
 # Adjust timeout settings
 result = inspect_mcp_server(
@@ -1001,7 +1387,7 @@ import psutil
 print(f"CPU usage: {{psutil.cpu_percent()}}%")
 print(f"Memory usage: {{psutil.virtual_memory().percent}}%")
 ```""",
-        "tool_error": """
+    "tool_error": """
 ```python
 # Test specific tool
 problematic_tool = "tool_name"  # Replace with actual tool name
@@ -1012,7 +1398,7 @@ test_result = call_mcp_tool(
 )
 print("Tool test result:", test_result)
 ```""",
-        "resource_error": """
+    "resource_error": """
 ```python
 # Test resource access
 resource_uri = "resource://example"  # Replace with actual resource URI
@@ -1022,7 +1408,7 @@ resource_test = read_mcp_resource(
 )
 print("Resource test result:", resource_test)
 ```""",
-        "config_error": """
+    "config_error": """
 ```python
 # Verify configuration file
 import yaml
@@ -1033,89 +1419,115 @@ try:
 except Exception as e:
     print(f"❌ Configuration file error: {{e}}")
 ```""",
-    }
-    return fixes.get(error_type, fixes["connection"])
+}
+_DEFAULT_FIX_STEPS: Final = _FIX_STEPS["connection"]
 
 
-def _get_environment_considerations(environment: str) -> str:
+def _get_specific_fix_steps(error_type: str | None, environment: str | None) -> str:
+    """Get specific fix steps based on error type and environment"""
+    return _FIX_STEPS.get(error_type, _DEFAULT_FIX_STEPS)
+
+
+_ENVIRONMENT_CONSIDERATIONS: Final[dict[str, str]] = {
+    "development": "- Can perform experimental fixes\n- Service restart has minimal impact\n- Recommend detailed repair process recording",
+    "testing": "- Need to consider test data integrity\n- Need to rerun tests after repairs\n- Record problem impact on test results",
+    "production": "- Prioritize service availability\n- Be cautious with any modifications\n- Must have complete rollback plan",
+}
+_DEFAULT_ENVIRONMENT_CONSIDERATIONS: Final = _ENVIRONMENT_CONSIDERATIONS["development"]
+
+
+def _get_environment_considerations(environment: str | None) -> str:
     """Get environment considerations"""
-    considerations = {
-        "development": "- Can perform experimental fixes\\n- Service restart has minimal impact\\n- Recommend detailed repair process recording",
-        "testing": "- Need to consider test data integrity\\n- Need to rerun tests after repairs\\n- Record problem impact on test results",
-        "production": "- Prioritize service availability\\n- Be cautious with any modifications\\n- Must have complete rollback plan",
-    }
-    return considerations.get(environment, considerations["development"])
+    return _ENVIRONMENT_CONSIDERATIONS.get(
+        environment, _DEFAULT_ENVIRONMENT_CONSIDERATIONS
+    )
 
 
-def _get_rollback_plan(error_type: str, environment: str) -> str:
+def _get_rollback_plan(error_type: str | None, environment: str | None) -> str:
     """Generate rollback plan"""
     if environment == "production":
-        return "- Immediately switch to backup server\\n- Rollback to previous stable version\\n- Notify users of service status"
+        return "- Immediately switch to backup server\n- Rollback to previous stable version\n- Notify users of service status"
     else:
-        return "- Restore to pre-repair configuration\\n- Restart service to known good state\\n- Record rollback reasons"
+        return "- Restore to pre-repair configuration\n- Restart service to known good state\n- Record rollback reasons"
+
+
+_ESCALATION_PATHS: Final[dict[str, str]] = {
+    "low": "If problem persists, contact technical lead",
+    "normal": "If unresolved within 30 minutes, escalate to senior engineer",
+    "high": "If unresolved within 15 minutes, immediately escalate to technical expert",
+    "critical": "If unresolved within 5 minutes, activate emergency response process",
+}
+_DEFAULT_ESCALATION_PATH: Final = _ESCALATION_PATHS["normal"]
 
 
 def _get_escalation_path(urgency: str) -> str:
     """Generate escalation path"""
-    paths = {
-        "low": "If problem persists, contact technical lead",
-        "normal": "If unresolved within 30 minutes, escalate to senior engineer",
-        "high": "If unresolved within 15 minutes, immediately escalate to technical expert",
-        "critical": "If unresolved within 5 minutes, activate emergency response process",
-    }
-    return paths.get(urgency, paths["normal"])
+    return _ESCALATION_PATHS.get(urgency, _DEFAULT_ESCALATION_PATH)
+
+
+_IMPROVEMENT_SUGGESTIONS: Final[dict[str, str]] = {
+    "connection": "- Implement health check mechanisms\n- Establish service auto-restart\n- Configure load balancing",
+    "timeout": "- Optimize code performance\n- Add caching mechanisms\n- Implement request throttling",
+    "tool_error": "- Strengthen input validation\n- Improve error handling\n- Add unit tests",
+    "resource_error": "- Verify resource paths\n- Implement permission checks\n- Support multiple formats",
+    "config_error": "- Configuration file validation\n- Provide default configuration\n- Environment variable checks",
+}
+_DEFAULT_IMPROVEMENT_SUGGESTIONS: Final = _IMPROVEMENT_SUGGESTIONS["connection"]
 
 
-def _get_improvement_suggestions(error_type: str) -> str:
+def _get_improvement_suggestions(error_type: str | None) -> str:
     """Get improvement suggestions based on error type"""
-    suggestions = {
-        "connection": "- Implement health check mechanisms\\n- Establish service auto-restart\\n- Configure load balancing",
-        "timeout": "- Optimize code performance\\n- Add caching mechanisms\\n- Implement request throttling",
-        "tool_error": "- Strengthen input validation\\n- Improve error handling\\n- Add unit tests",
-        "resource_error": "- Verify resource paths\\n- Implement permission checks\\n- Support multiple formats",
-        "config_error": "- Configuration file validation\\n- Provide default configuration\\n- Environment variable checks",
+    return _IMPROVEMENT_SUGGESTIONS.get(error_type, _DEFAULT_IMPROVEMENT_SUGGESTIONS)
+
+
+def _troubleshooting_fragments(
+    error_type: str | None, environment: str | None, urgency: str
+) -> dict[str, str]:
+    """Resolve the derived fields of the troubleshooting template."""
+    return {
+        "response_strategy": _get_response_strategy(urgency),
+        "error_symptoms": _get_error_symptoms(error_type),
+        "possible_causes": _get_possible_causes(error_type),
+        "impact_assessment": _get_impact_assessment(error_type, environment),
+        "specific_fix_steps": _get_specific_fix_steps(error_type, environment),
+        "environment_considerations": _get_environment_considerations(environment),
+        "rollback_plan": _get_rollback_plan(error_type, environment),
+        "escalation_path": _get_escalation_path(urgency),
+        "improvement_suggestions": _get_improvement_suggestions(error_type),
     }
-    return suggestions.get(error_type, suggestions["connection"])
 
 
-def best_practices_prompt(
-    use_case: str = "general",
-    team_size: str = "small",
-    automation_level: str = "medium",
-) -> str:
-    """
-    Generate MCP server best practices guidance.
-
-    Args:
-        use_case: Use case scenario (general, ci_cd, development, production, research)
-        team_size: Team size (individual, small, medium, large)
-        automation_level: Automation level (manual, medium, high)
+# Derived fields for every canonical (error_type, environment, urgency) triple.
+# None keeps undocumented error types and environments distinct, since the
+# impact assessment has its own fallback for them
+_TROUBLESHOOTING_FRAGMENTS: Final[
+    dict[tuple[str | None, str | None, str], dict[str, str]]
+] = {
+    (error_type, environment, urgency): _troubleshooting_fragments(
+        error_type, environment, urgency
+    )
+    for error_type in (*_VALID["error_type"], None)
+    for environment in (*_VALID["server_environment"], None)
+    for urgency in _VALID["urgency_level"]
+}
 
-    Returns:
-        str: Structured professional best practices recommendations
-    """
 
-    return f"""
-<role>
-You are a senior MCP server architect and best practices expert, specializing in guiding teams to establish efficient server management and testing systems.
+# Section contents of the best_practices_prompt template
+_BEST_PRACTICES_ROLE = """You are a senior MCP server architect and best practices expert, specializing in guiding teams to establish efficient server management and testing systems.
 Your professional background: Rich experience in enterprise-level system architecture, deep understanding of DevOps and quality assurance best practices
 Work approach: Systematic thinking, focus on long-term value, provide sustainable solutions
-Core responsibility: Help teams establish standardized, automated, scalable MCP server management systems
-</role>
+Core responsibility: Help teams establish standardized, automated, scalable MCP server management systems"""
 
-<context>
-Business context: MCP server management needs in {use_case} scenario
+_BEST_PRACTICES_CONTEXT_TMPL = """Business context: MCP server management needs in {use_case} scenario
 Team size: {team_size} team, need to adapt corresponding collaboration modes
 Automation level: {automation_level} level automation requirements
 Industry standards: Follow DevOps, SRE and software engineering best practices
 Key constraints:
 - Must adapt to team's technical capabilities and resource limitations
 - Solutions must have scalability and maintainability
-- Need to balance efficiency, quality and cost
-</context>
+- Need to balance efficiency, quality and cost"""
 
-<knowledge_base>
-Professional terminology:
+_BEST_PRACTICES_KNOWLEDGE_BASE = """Professional terminology:
 - SRE (Site Reliability Engineering): Site reliability engineering, operational methodology proposed by Google
 - CI/CD: Continuous Integration/Continuous Deployment, automated software delivery pipeline
 - Infrastructure as Code: Manage infrastructure through code
@@ -1131,11 +1543,9 @@ Team size characteristics:
 Automation levels:
 - Manual: Mainly manual operations, tool assistance
 - Medium: Partial automation, standardized key processes
-- High: Highly automated, intelligent operations
-</knowledge_base>
+- High: Highly automated, intelligent operations"""
 
-<input>
-Input type: Best practices configuration parameters
+_BEST_PRACTICES_INPUT_TMPL = """Input type: Best practices configuration parameters
 Key fields:
 - use_case: {use_case} (determines practice focus and depth)
 - team_size: {team_size} (affects collaboration mode and tool selection)
@@ -1144,11 +1554,9 @@ Key fields:
 Current practice configuration:
 Use case: {use_case}
 Team size: {team_size}
-Automation level: {automation_level}
-</input>
+Automation level: {automation_level}"""
 
-<instructions>
-Please develop structured best practices guidance following these steps:
+_BEST_PRACTICES_INSTRUCTIONS = """Please develop structured best practices guidance following these steps:
 
 1. **Current State Assessment Phase**
    - Analyze current team capabilities and resource status
@@ -1173,11 +1581,9 @@ Please develop structured best practices guidance following these steps:
 5. **Continuous Improvement Phase**
    - Establish measurement and monitoring systems
    - Regularly evaluate and optimize practices
-   - Promote knowledge accumulation and experience sharing
-</instructions>
+   - Promote knowledge accumulation and experience sharing"""
 
-<examples>
-**Example 1 - Individual Developer General Scenario**
+_BEST_PRACTICES_EXAMPLES = """**Example 1 - Individual Developer General Scenario**
 Input: use_case="general", team_size="individual", automation_level="medium"
 Output:
 ```
@@ -1199,11 +1605,9 @@ Enterprise strategy: Standardized processes, automated delivery
 - Integrate mcp-inspector-server into CI/CD pipeline
 - Establish code quality gates and automated testing
 - Implement infrastructure as code and environment consistency
-```
-</examples>
+```"""
 
-<output_requirements>
-Quality standards:
+_BEST_PRACTICES_OUTPUT_REQUIREMENTS = """Quality standards:
 - Practice recommendations must be actionable and measurable
 - Fully consider team size and technical capability limitations
 - Provide specific tool usage guidance and implementation steps
@@ -1219,11 +1623,9 @@ Self-check list:
 □ Does it fully consider use case requirements
 □ Does it adapt to team size characteristics
 □ Does it match automation level requirements
-□ Does it provide executable implementation plans
-</output_requirements>
+□ Does it provide executable implementation plans"""
 
-<best_practices>
-# 🎯 MCP Server Management Best Practices
+_BEST_PRACTICES_BODY_TMPL = """# 🎯 MCP Server Management Best Practices
 
 ## 📋 Practice Overview
 - **Application scenario**: {use_case} environment
@@ -1233,27 +1635,27 @@ Self-check list:
 ## 🔍 Current State Analysis
 
 ### Team Capability Assessment
-{_get_team_capability_assessment(team_size)}
+{team_capability_assessment}
 
 ### Scenario Requirements Analysis
-{_get_use_case_requirements(use_case)}
+{use_case_requirements}
 
 ### Automation Maturity
-{_get_automation_maturity(automation_level)}
+{automation_maturity}
 
 ## 🎯 Goal Setting
 
 ### Short-term Goals (1-3 months)
-{_get_short_term_goals(use_case, team_size)}
+{short_term_goals}
 
 ### Long-term Goals (6-12 months)
-{_get_long_term_goals(use_case, automation_level)}
+{long_term_goals}
 
 ### Success Metrics
 - Test coverage > 80%
 - Average response time < 2 seconds
 - Fault recovery time < 5 minutes
-{_get_additional_success_metrics(use_case, team_size)}
+{additional_success_metrics}
 
 ## 🛠️ Core Practices
 
@@ -1288,24 +1690,24 @@ print(f"Testing completed, response time: {{test_results['response_time']:.2f}}
 ```
 
 ### 2. Quality Assurance Practices
-{_get_quality_assurance_practices(use_case, team_size)}
+{quality_assurance_practices}
 
 ### 3. Automation Practices
-{_get_automation_practices(automation_level, team_size)}
+{automation_practices}
 
 ### 4. Collaboration Practices
-{_get_collaboration_practices(team_size)}
+{collaboration_practices}
 
 ## 📊 Implementation Roadmap
 
 ### Phase 1: Foundation Building (Week 1-4)
-{_get_phase1_tasks(team_size, automation_level)}
+{phase1_tasks}
 
 ### Phase 2: Process Optimization (Week 5-8)
-{_get_phase2_tasks(use_case, automation_level)}
+{phase2_tasks}
 
 ### Phase 3: Advanced Practices (Week 9-12)
-{_get_phase3_tasks(use_case, team_size)}
+{phase3_tasks}
 
 ## 🔧 Tool Configuration
 
@@ -1340,12 +1742,12 @@ batch_result = batch_inspect_servers([
 ```
 
 ### CI/CD Integration Example
-{_get_cicd_integration_example(use_case, automation_level)}
+{cicd_integration_example}
 
 ## 📈 Monitoring and Metrics
 
 ### Key Metrics
-{_get_key_metrics(use_case)}
+{key_metrics}
 
 ### Monitoring Implementation
 ```python
@@ -1370,10 +1772,10 @@ schedule.every(5).minutes.do(health_check_routine)
 ## 🚨 Risk Management
 
 ### Common Risks
-{_get_common_risks(use_case, team_size)}
+{common_risks}
 
 ### Mitigation Strategies
-{_get_risk_mitigation_strategies(use_case, automation_level)}
+{risk_mitigation_strategies}
 
 ## 🔄 Continuous Improvement
 
@@ -1388,153 +1790,289 @@ schedule.every(5).minutes.do(health_check_routine)
 - Regularly update tools and process documentation
 
 ### Skill Development
-{_get_skill_development_plan(team_size, automation_level)}
+{skill_development_plan}
 
 ---
-*Professional best practices guidance based on Anthropic's 6-layer golden structure framework*
-</best_practices>
-"""
+*Professional best practices guidance based on Anthropic's 6-layer golden structure framework*"""
+
+_BEST_PRACTICES_TMPL = _build_skeleton(
+    role=_BEST_PRACTICES_ROLE,
+    context=_BEST_PRACTICES_CONTEXT_TMPL,
+    knowledge_base=_BEST_PRACTICES_KNOWLEDGE_BASE,
+    input=_BEST_PRACTICES_INPUT_TMPL,
+    instructions=_BEST_PRACTICES_INSTRUCTIONS,
+    examples=_BEST_PRACTICES_EXAMPLES,
+    output_requirements=_BEST_PRACTICES_OUTPUT_REQUIREMENTS,
+    body_tag="best_practices",
+    body=_BEST_PRACTICES_BODY_TMPL,
+)
+
+
+@cache
+def _best_practices_template() -> _Segments:
+    """Compile the best_practices_prompt template on first use."""
+    return _compile_template(_BEST_PRACTICES_TMPL)
+
+
+def best_practices_prompt(
+    use_case: str = "general",
+    team_size: str = "small",
+    automation_level: str = "medium",
+) -> str:
+    """
+    Generate MCP server best practices guidance.
+
+    Args:
+        use_case: Use case scenario (general, ci_cd, development, production, research)
+        team_size: Team size (individual, small, medium, large)
+        automation_level: Automation level (manual, medium, high)
+
+    Returns:
+        str: Structured professional best practices recommendations
+    """
+    return _build_best_practices(
+        _intern_arg(use_case),
+        _intern_arg(team_size),
+        _intern_arg(automation_level),
+    )
+
+
+@lru_cache(maxsize=128)
+def _build_best_practices(use_case: str, team_size: str, automation_level: str) -> str:
+    """Render best practices guidance; the output depends only on the arguments."""
+    # Undocumented values fall back to the same guidance as the defaults
+    fragments = _BEST_PRACTICES_FRAGMENTS[
+        (
+            _canon("use_case", use_case, "general"),
+            _canon("team_size", team_size, "small"),
+            _canon("automation_level", automation_level, "medium"),
+        )
+    ]
+    return _render(
+        _best_practices_template(),
+        {
+            "use_case": use_case,
+            "team_size": team_size,
+            "automation_level": automation_level,
+            **fragments,
+        },
+    )
 
 
 # Helper functions for best practices
+def _select(rules: Mapping[tuple[str, str], str], primary: str, secondary: str) -> str:
+    """
+    Pick the most specific rule from a two-key decision table
+
+    Rules are keyed by (primary, secondary) values, with "*" matching any
+    value. An exact match wins, then a primary match, then a secondary
+    match, then the ("*", "*") default.
+    """
+    for key in (
+        (primary, secondary),
+        (primary, "*"),
+        ("*", secondary),
+        ("*", "*"),
+    ):
+        if key in rules:
+            return rules[key]
+    raise KeyError((primary, secondary))
+
+
+_TEAM_ASSESSMENTS: Final[dict[str, str]] = {
+    "individual": "Independent developer, needs efficient personal tools and automation",
+    "small": "Small team, focus on collaboration efficiency and knowledge sharing",
+    "medium": "Medium team, needs standardized processes and role division",
+    "large": "Large team, needs enterprise-level governance and scaled management",
+}
+_DEFAULT_TEAM_ASSESSMENT: Final = _TEAM_ASSESSMENTS["small"]
+
+
 def _get_team_capability_assessment(team_size: str) -> str:
     """Assess team capabilities"""
-    assessments = {
-        "individual": "Independent developer, needs efficient personal tools and automation",
-        "small": "Small team, focus on collaboration efficiency and knowledge sharing",
-        "medium": "Medium team, needs standardized processes and role division",
-        "large": "Large team, needs enterprise-level governance and scaled management",
-    }
-    return assessments.get(team_size, assessments["small"])
+    return _TEAM_ASSESSMENTS.get(team_size, _DEFAULT_TEAM_ASSESSMENT)
+
+
+_USE_CASE_REQUIREMENTS: Final[dict[str, str]] = {
+    "general": "General scenario, balance functionality and usability",
+    "ci_cd": "Continuous integration scenario, focus on automation and reliability",
+    "development": "Development scenario, focus on quick feedback and debugging capabilities",
+    "production": "Production scenario, focus on stability and monitoring",
+    "research": "Research scenario, focus on flexibility and extensibility",
+}
+_DEFAULT_USE_CASE_REQUIREMENTS: Final = _USE_CASE_REQUIREMENTS["general"]
 
 
 def _get_use_case_requirements(use_case: str) -> str:
     """Analyze use case requirements"""
-    requirements = {
-        "general": "General scenario, balance functionality and usability",
-        "ci_cd": "Continuous integration scenario, focus on automation and reliability",
-        "development": "Development scenario, focus on quick feedback and debugging capabilities",
-        "production": "Production scenario, focus on stability and monitoring",
-        "research": "Research scenario, focus on flexibility and extensibility",
-    }
-    return requirements.get(use_case, requirements["general"])
+    return _USE_CASE_REQUIREMENTS.get(use_case, _DEFAULT_USE_CASE_REQUIREMENTS)
+
+
+_AUTOMATION_MATURITY: Final[dict[str, str]] = {
+    "manual": "Mainly manual operations, tool-assisted decision making",
+    "medium": "Key process automation, human supervision",
+    "high": "Highly automated, intelligent decision making",
+}
+_DEFAULT_AUTOMATION_MATURITY: Final = _AUTOMATION_MATURITY["medium"]
 
 
 def _get_automation_maturity(automation_level: str) -> str:
     """Assess automation maturity"""
-    maturity = {
-        "manual": "Mainly manual operations, tool-assisted decision making",
-        "medium": "Key process automation, human supervision",
-        "high": "Highly automated, intelligent decision making",
-    }
-    return maturity.get(automation_level, maturity["medium"])
+    return _AUTOMATION_MATURITY.get(automation_level, _DEFAULT_AUTOMATION_MATURITY)
+
+
+_SHORT_TERM_GOALS: Final[dict[tuple[str, str], str]] = {
+    ("individual", "*"): (
+        "- Establish personal testing workflow\n- Master mcp-inspector-server core functions\n- Establish basic monitoring"
+    ),
+    ("*", "ci_cd"): (
+        "- Integrate automated testing into CI pipeline\n- Establish quality gates\n- Implement automated deployment verification"
+    ),
+    ("*", "*"): (
+        "- Standardize testing processes\n- Establish team collaboration standards\n- Implement basic monitoring"
+    ),
+}
 
 
 def _get_short_term_goals(use_case: str, team_size: str) -> str:
     """Set short-term goals"""
-    if team_size == "individual":
-        return "- Establish personal testing workflow\\n- Master mcp-inspector-server core functions\\n- Establish basic monitoring"
-    elif use_case == "ci_cd":
-        return "- Integrate automated testing into CI pipeline\\n- Establish quality gates\\n- Implement automated deployment verification"
-    else:
-        return "- Standardize testing processes\\n- Establish team collaboration standards\\n- Implement basic monitoring"
+    return _select(_SHORT_TERM_GOALS, team_size, use_case)
+
+
+_LONG_TERM_GOALS: Final[dict[tuple[str, str], str]] = {
+    ("high", "*"): (
+        "- Achieve fully automated testing and deployment\n- Establish intelligent monitoring and alerting\n- Implement predictive maintenance"
+    ),
+    ("*", "production"): (
+        "- Establish enterprise-level service governance\n- Implement SRE best practices\n- Establish comprehensive observability"
+    ),
+    ("*", "*"): (
+        "- Establish complete quality assurance system\n- Achieve efficient team collaboration\n- Establish continuous improvement mechanisms"
+    ),
+}
 
 
 def _get_long_term_goals(use_case: str, automation_level: str) -> str:
     """Set long-term goals"""
-    if automation_level == "high":
-        return "- Achieve fully automated testing and deployment\\n- Establish intelligent monitoring and alerting\\n- Implement predictive maintenance"
-    elif use_case == "production":
-        return "- Establish enterprise-level service governance\\n- Implement SRE best practices\\n- Establish comprehensive observability"
-    else:
-        return "- Establish complete quality assurance system\\n- Achieve efficient team collaboration\\n- Establish continuous improvement mechanisms"
+    return _select(_LONG_TERM_GOALS, automation_level, use_case)
+
+
+_ADDITIONAL_SUCCESS_METRICS: Final[dict[tuple[str, str], str]] = {
+    ("production", "*"): "\n- Service availability > 99.9%\n- Error rate < 0.1%",
+    ("*", "large"): (
+        "\n- Team efficiency improvement > 30%\n- Knowledge sharing coverage > 90%"
+    ),
+    ("*", "*"): "",
+}
 
 
 def _get_additional_success_metrics(use_case: str, team_size: str) -> str:
     """Get additional success metrics"""
-    if use_case == "production":
-        return "\\n- Service availability > 99.9%\\n- Error rate < 0.1%"
-    elif team_size == "large":
-        return "\\n- Team efficiency improvement > 30%\\n- Knowledge sharing coverage > 90%"
-    else:
-        return ""
+    return _select(_ADDITIONAL_SUCCESS_METRICS, use_case, team_size)
 
 
-def _get_quality_assurance_practices(use_case: str, team_size: str) -> str:
-    """Quality assurance practices"""
-    if use_case == "production":
-        return """
+_QUALITY_ASSURANCE_PRACTICES: Final[dict[tuple[str, str], str]] = {
+    ("production", "*"): """
 - Multi-layer testing strategy (unit, integration, end-to-end)
 - Automated regression testing and performance testing
 - Production environment monitoring and alerting
-- Error budget and SLI/SLO management"""
-    else:
-        return """
+- Error budget and SLI/SLO management""",
+    ("*", "*"): """
 - Standardized testing processes and checklists
 - Code review and quality gates
 - Automated testing and continuous integration
-- Regular quality assessment and improvement"""
+- Regular quality assessment and improvement""",
+}
+
+
+def _get_quality_assurance_practices(use_case: str, team_size: str) -> str:
+    """Quality assurance practices"""
+    return _select(_QUALITY_ASSURANCE_PRACTICES, use_case, team_size)
+
+
+_AUTOMATION_PRACTICES: Final[dict[str, str]] = {
+    "manual": "- Use mcp-inspector-server for manual testing\n- Establish testing checklists\n- Record test results and issues",
+    "medium": "- Automate daily testing processes\n- Integrate CI/CD pipeline\n- Auto-generate test reports",
+    "high": "- Fully automated testing and deployment\n- Intelligent monitoring and alerting\n- Automated fault recovery",
+}
+_DEFAULT_AUTOMATION_PRACTICES: Final = _AUTOMATION_PRACTICES["medium"]
 
 
 def _get_automation_practices(automation_level: str, team_size: str) -> str:
     """Automation practices"""
-    practices = {
-        "manual": "- Use mcp-inspector-server for manual testing\\n- Establish testing checklists\\n- Record test results and issues",
-        "medium": "- Automate daily testing processes\\n- Integrate CI/CD pipeline\\n- Auto-generate test reports",
-        "high": "- Fully automated testing and deployment\\n- Intelligent monitoring and alerting\\n- Automated fault recovery",
-    }
-    return practices.get(automation_level, practices["medium"])
+    return _AUTOMATION_PRACTICES.get(automation_level, _DEFAULT_AUTOMATION_PRACTICES)
+
+
+_COLLABORATION_PRACTICES: Final[dict[str, str]] = {
+    "individual": "- Establish personal knowledge base\n- Use version control for configuration management\n- Regular backup and sync",
+    "small": "- Establish shared testing standards\n- Regular team sync meetings\n- Knowledge documentation and sharing",
+    "medium": "- Establish role division and responsibility matrix\n- Implement code review processes\n- Establish training and knowledge transfer mechanisms",
+    "large": "- Establish cross-team collaboration mechanisms\n- Implement enterprise-level governance processes\n- Establish specialized teams and CoE",
+}
+_DEFAULT_COLLABORATION_PRACTICES: Final = _COLLABORATION_PRACTICES["small"]
 
 
 def _get_collaboration_practices(team_size: str) -> str:
     """Collaboration practices"""
-    practices = {
-        "individual": "- Establish personal knowledge base\\n- Use version control for configuration management\\n- Regular backup and sync",
-        "small": "- Establish shared testing standards\\n- Regular team sync meetings\\n- Knowledge documentation and sharing",
-        "medium": "- Establish role division and responsibility matrix\\n- Implement code review processes\\n- Establish training and knowledge transfer mechanisms",
-        "large": "- Establish cross-team collaboration mechanisms\\n- Implement enterprise-level governance processes\\n- Establish specialized teams and CoE",
-    }
-    return practices.get(team_size, practices["small"])
+    return _COLLABORATION_PRACTICES.get(team_size, _DEFAULT_COLLABORATION_PRACTICES)
+
+
+_PHASE1_BASE_TASKS = "- Install and configure mcp-inspector-server\n- Establish basic testing processes\n- Train team members"
+_PHASE1_AUTOMATED_TASKS: Final = (
+    _PHASE1_BASE_TASKS
+    + "\n- Design automation architecture\n- Select and configure CI/CD tools"
+)
+_PHASE1_MANUAL_TASKS: Final = (
+    _PHASE1_BASE_TASKS
+    + "\n- Establish manual testing checklists\n- Develop testing standards and specifications"
+)
+
+
+_PHASE1_TASKS: Final[dict[tuple[str, str], str]] = {
+    ("high", "*"): _PHASE1_AUTOMATED_TASKS,
+    ("*", "*"): _PHASE1_MANUAL_TASKS,
+}
 
 
 def _get_phase1_tasks(team_size: str, automation_level: str) -> str:
     """Phase 1 tasks"""
-    base_tasks = "- Install and configure mcp-inspector-server\\n- Establish basic testing processes\\n- Train team members"
+    return _select(_PHASE1_TASKS, automation_level, team_size)
 
-    if automation_level == "high":
-        return (
-            base_tasks
-            + "\\n- Design automation architecture\\n- Select and configure CI/CD tools"
-        )
-    else:
-        return (
-            base_tasks
-            + "\\n- Establish manual testing checklists\\n- Develop testing standards and specifications"
-        )
+
+_PHASE2_TASKS: Final[dict[tuple[str, str], str]] = {
+    ("ci_cd", "*"): (
+        "- Integrate testing into CI/CD pipeline\n- Establish quality gates\n- Implement automated reporting"
+    ),
+    ("*", "*"): (
+        "- Optimize testing processes\n- Establish monitoring and alerting\n- Implement quality metrics"
+    ),
+}
 
 
 def _get_phase2_tasks(use_case: str, automation_level: str) -> str:
     """Phase 2 tasks"""
-    if use_case == "ci_cd":
-        return "- Integrate testing into CI/CD pipeline\\n- Establish quality gates\\n- Implement automated reporting"
-    else:
-        return "- Optimize testing processes\\n- Establish monitoring and alerting\\n- Implement quality metrics"
+    return _select(_PHASE2_TASKS, use_case, automation_level)
+
+
+_PHASE3_TASKS: Final[dict[tuple[str, str], str]] = {
+    ("production", "*"): (
+        "- Implement SRE practices\n- Establish observability system\n- Achieve intelligent operations"
+    ),
+    ("*", "large"): (
+        "- Establish enterprise-level governance\n- Implement scaled management\n- Establish CoE and best practices"
+    ),
+    ("*", "*"): (
+        "- Implement advanced testing strategies\n- Establish continuous improvement mechanisms\n- Expand tools and capabilities"
+    ),
+}
 
 
 def _get_phase3_tasks(use_case: str, team_size: str) -> str:
     """Phase 3 tasks"""
-    if use_case == "production":
-        return "- Implement SRE practices\\n- Establish observability system\\n- Achieve intelligent operations"
-    elif team_size == "large":
-        return "- Establish enterprise-level governance\\n- Implement scaled management\\n- Establish CoE and best practices"
-    else:
-        return "- Implement advanced testing strategies\\n- Establish continuous improvement mechanisms\\n- Expand tools and capabilities"
+    return _select(_PHASE3_TASKS, use_case, team_size)
 
 
-def _get_cicd_integration_example(use_case: str, automation_level: str) -> str:
-    """CI/CD integration example"""
-    if use_case == "ci_cd" and automation_level == "high":
-        return """
+_CICD_GHA_EXAMPLE: Final = """
 ```yaml
 # GitHub Actions example
 name: MCP Server CI/CD
@@ -1561,48 +2099,131 @@ jobs:
           assert result['success'], f'Tests failed: {result}'
           "
 ```"""
-    else:
-        return "Configure appropriate CI/CD integration based on team needs"
+_CICD_GENERIC_EXAMPLE: Final = (
+    "Configure appropriate CI/CD integration based on team needs"
+)
+
+
+_CICD_INTEGRATION_EXAMPLES: Final[dict[tuple[str, str], str]] = {
+    ("ci_cd", "high"): _CICD_GHA_EXAMPLE,
+    ("*", "*"): _CICD_GENERIC_EXAMPLE,
+}
+
+
+def _get_cicd_integration_example(use_case: str, automation_level: str) -> str:
+    """CI/CD integration example"""
+    return _select(_CICD_INTEGRATION_EXAMPLES, use_case, automation_level)
+
+
+_KEY_METRICS: Final[dict[str, str]] = {
+    "general": "- Test execution time\n- Problem discovery rate\n- Fix time",
+    "ci_cd": "- Build success rate\n- Deployment frequency\n- Change failure rate",
+    "production": "- Service availability\n- Response time\n- Error rate",
+    "development": "- Development efficiency\n- Code quality\n- Feedback time",
+}
+_DEFAULT_KEY_METRICS: Final = _KEY_METRICS["general"]
 
 
 def _get_key_metrics(use_case: str) -> str:
     """Key metrics"""
-    metrics = {
-        "general": "- Test execution time\\n- Problem discovery rate\\n- Fix time",
-        "ci_cd": "- Build success rate\\n- Deployment frequency\\n- Change failure rate",
-        "production": "- Service availability\\n- Response time\\n- Error rate",
-        "development": "- Development efficiency\\n- Code quality\\n- Feedback time",
-    }
-    return metrics.get(use_case, metrics["general"])
+    return _KEY_METRICS.get(use_case, _DEFAULT_KEY_METRICS)
+
+
+_COMMON_RISKS: Final[dict[tuple[str, str], str]] = {
+    ("production", "*"): (
+        "- Production environment failures\n- Data loss or corruption\n- Security vulnerability exposure"
+    ),
+    ("*", "large"): (
+        "- Team collaboration conflicts\n- Knowledge silos\n- Process complexity"
+    ),
+    ("*", "*"): (
+        "- Tool learning costs\n- Inconsistent process execution\n- Unclear quality standards"
+    ),
+}
 
 
 def _get_common_risks(use_case: str, team_size: str) -> str:
     """Common risks"""
-    if use_case == "production":
-        return "- Production environment failures\\n- Data loss or corruption\\n- Security vulnerability exposure"
-    elif team_size == "large":
-        return (
-            "- Team collaboration conflicts\\n- Knowledge silos\\n- Process complexity"
-        )
-    else:
-        return "- Tool learning costs\\n- Inconsistent process execution\\n- Unclear quality standards"
+    return _select(_COMMON_RISKS, use_case, team_size)
+
+
+_RISK_MITIGATION_STRATEGIES: Final[dict[tuple[str, str], str]] = {
+    ("production", "*"): (
+        "- Establish complete backup and recovery mechanisms\n- Implement blue-green deployment and canary releases\n- Establish security audits and compliance checks"
+    ),
+    ("*", "high"): (
+        "- Establish automated monitoring and alerting\n- Implement automated fault recovery\n- Establish intelligent decision support"
+    ),
+    ("*", "*"): (
+        "- Establish standardized processes and checklists\n- Implement training and knowledge transfer\n- Establish regular evaluation and improvement mechanisms"
+    ),
+}
 
 
 def _get_risk_mitigation_strategies(use_case: str, automation_level: str) -> str:
     """Risk mitigation strategies"""
-    if use_case == "production":
-        return "- Establish complete backup and recovery mechanisms\\n- Implement blue-green deployment and canary releases\\n- Establish security audits and compliance checks"
-    elif automation_level == "high":
-        return "- Establish automated monitoring and alerting\\n- Implement automated fault recovery\\n- Establish intelligent decision support"
-    else:
-        return "- Establish standardized processes and checklists\\n- Implement training and knowledge transfer\\n- Establish regular evaluation and improvement mechanisms"
+    return _select(_RISK_MITIGATION_STRATEGIES, use_case, automation_level)
+
+
+_SKILL_DEVELOPMENT_PLANS: Final[dict[tuple[str, str], str]] = {
+    ("large", "*"): (
+        "- Establish tiered training system\n- Implement mentorship and knowledge sharing\n- Establish professional certification and career development paths"
+    ),
+    ("*", "high"): (
+        "- Learn automation tools and technologies\n- Master DevOps and SRE practices\n- Develop systems thinking and problem-solving skills"
+    ),
+    ("*", "*"): (
+        "- Master mcp-inspector-server advanced features\n- Learn testing and quality assurance best practices\n- Develop continuous learning and improvement mindset"
+    ),
+}
 
 
 def _get_skill_development_plan(team_size: str, automation_level: str) -> str:
     """Skill development plan"""
-    if team_size == "large":
-        return "- Establish tiered training system\\n- Implement mentorship and knowledge sharing\\n- Establish professional certification and career development paths"
-    elif automation_level == "high":
-        return "- Learn automation tools and technologies\\n- Master DevOps and SRE practices\\n- Develop systems thinking and problem-solving skills"
-    else:
-        return "- Master mcp-inspector-server advanced features\\n- Learn testing and quality assurance best practices\\n- Develop continuous learning and improvement mindset"
+    return _select(_SKILL_DEVELOPMENT_PLANS, team_size, automation_level)
+
+
+def _best_practices_fragments(
+    use_case: str, team_size: str, automation_level: str
+) -> dict[str, str]:
+    """Resolve the derived fields of the best practices template."""
+    return {
+        "team_capability_assessment": _get_team_capability_assessment(team_size),
+        "use_case_requirements": _get_use_case_requirements(use_case),
+        "automation_maturity": _get_automation_maturity(automation_level),
+        "short_term_goals": _get_short_term_goals(use_case, team_size),
+        "long_term_goals": _get_long_term_goals(use_case, automation_level),
+        "additional_success_metrics": _get_additional_success_metrics(
+            use_case, team_size
+        ),
+        "quality_assurance_practices": _get_quality_assurance_practices(
+            use_case, team_size
+        ),
+        "automation_practices": _get_automation_practices(automation_level, team_size),
+        "collaboration_practices": _get_collaboration_practices(team_size),
+        "phase1_tasks": _get_phase1_tasks(team_size, automation_level),
+        "phase2_tasks": _get_phase2_tasks(use_case, automation_level),
+        "phase3_tasks": _get_phase3_tasks(use_case, team_size),
+        "cicd_integration_example": _get_cicd_integration_example(
+            use_case, automation_level
+        ),
+        "key_metrics": _get_key_metrics(use_case),
+        "common_risks": _get_common_risks(use_case, team_size),
+        "risk_mitigation_strategies": _get_risk_mitigation_strategies(
+            use_case, automation_level
+        ),
+        "skill_development_plan": _get_skill_development_plan(
+            team_size, automation_level
+        ),
+    }
+
+
+# Derived fields for every canonical (use_case, team_size, automation) triple
+_BEST_PRACTICES_FRAGMENTS: Final[dict[tuple[str, str, str], dict[str, str]]] = {
+    (use_case, team_size, automation_level): _best_practices_fragments(
+        use_case, team_size, automation_level
+    )
+    for use_case in _VALID["use_case"]
+    for team_size in _VALID["team_size"]
+    for automation_level in _VALID["automation_level"]
+}
@@ -3,10 +3,31 @@ MCP Inspector Tools - Fixed Version
 Professional MCP server testing and inspection tools with direct parameters (mcp-factory compatible)
 """
 
+import copy
 import json
+import logging
+import os
+import shlex
+import shutil
 import subprocess
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
+
+try:
+    import orjson
+
+    # orjson parses the inspector's JSON output considerably faster; its
+    # JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 __all__ = [
     "inspect_mcp_server",
@@ -23,33 +44,163 @@ __all__ = [
 ]
 
 
+# Listings probed by comprehensive_server_test, keyed by result name
+_PROBES = (
+    ("tools_list", "tools/list"),
+    ("resources_list", "resources/list"),
+    ("prompts_list", "prompts/list"),
+)
+
+
+# Listing methods are read-only, so their results are cached for a short while;
+# calls, reads and prompt fetches always run
+_CACHEABLE_METHODS = frozenset(
+    {"tools/list", "resources/list", "prompts/list", "resource_templates/list"}
+)
+_CACHE_TTL = 300
+_CACHE_MAX = 1000
+_RESULT_CACHE: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+@cache
+def _inspector_cmd() -> tuple[str, ...]:
+    """
+    Resolve how to launch MCP Inspector, once per process
+
+    Prefers an installed ``mcp-inspector`` executable (project-local
+    ``node_modules/.bin`` first, then PATH) so each run skips npx's package
+    resolution; falls back to npx when the inspector is not installed.
+    """
+    local_bin = Path.cwd() / "node_modules" / ".bin"
+    inspector = shutil.which("mcp-inspector", path=str(local_bin)) or shutil.which(
+        "mcp-inspector"
+    )
+    if inspector:
+        return (inspector,)
+    return ("npx", "@modelcontextprotocol/inspector")
+
+
+_POSIX_ARGS: Final = os.name != "nt"
+
+
+@lru_cache(maxsize=256)
+def _split_args(server_args: str | None) -> tuple[str, ...]:
+    """
+    Tokenize server arguments with shell quoting rules
+
+    POSIX rules treat backslashes as escapes, so Windows keeps them literal
+    to preserve paths such as C:\\Users\\me\\cfg.json. Non-POSIX mode leaves
+    the quotes on a quoted argument, so they are stripped here instead.
+    """
+    if not server_args:
+        return ()
+    if _POSIX_ARGS:
+        return tuple(shlex.split(server_args))
+    return tuple(
+        token[1:-1]
+        if len(token) >= 2 and token[0] == token[-1] and token[0] in "\"'"
+        else token
+        for token in shlex.split(server_args, posix=False)
+    )
+
+
 def _run_inspector_command(
     server_command: str,
     method: str,
-    server_args: str | None = None,
+    server_args: str | list[str] | None = None,
     tool_arguments: str | None = None,
     timeout: int = 30,
+    bypass_cache: bool = False,
 ) -> dict[str, Any]:
     """
     Run MCP Inspector command and return parsed results
 
+    Results of read-only listing methods are served from a short-lived cache
+    unless bypass_cache is set.
+
     Args:
         server_command: Command to start the MCP server
         method: Inspector method to call
-        server_args: Additional server arguments
+        server_args: Additional server arguments, as a string or pre-split list
         tool_arguments: Tool-specific arguments
         timeout: Command timeout in seconds
+        bypass_cache: Always run the inspector, ignoring cached results
 
     Returns:
         Parsed JSON result from inspector
     """
-    try:
-        # Build the inspector command
-        cmd_parts = ["npx", "@modelcontextprotocol/inspector", "--cli", server_command]
+    if not isinstance(server_command, str):
+        return {"success": False, "error": "Invalid server command: expected a string"}
 
-        if server_args:
-            cmd_parts.extend(server_args.split())
+    if isinstance(server_args, list):
+        if not all(isinstance(arg, str) for arg in server_args):
+            return {
+                "success": False,
+                "error": "Invalid server arguments: list items must be strings",
+            }
+        args = tuple(server_args)
+    elif server_args is None or isinstance(server_args, str):
+        try:
+            args = _split_args(server_args)
+        except ValueError as e:
+            return {"success": False, "error": f"Invalid server arguments: {str(e)}"}
+    else:
+        return {
+            "success": False,
+            "error": "Invalid server arguments: expected a string or a list of strings",
+        }
 
+    if tool_arguments:
+        # Reject malformed arguments before paying for an inspector process
+        if not isinstance(tool_arguments, str):
+            return {
+                "success": False,
+                "error": "Invalid arguments: expected a JSON string",
+            }
+        try:
+            _loads(tool_arguments)
+        except json.JSONDecodeError:
+            return {"success": False, "error": "Invalid JSON in arguments"}
+
+    if method not in _CACHEABLE_METHODS or tool_arguments:
+        return _execute_inspector_command(
+            server_command, method, args, tool_arguments, timeout
+        )
+
+    key = (server_command, args, method)
+    if not bypass_cache:
+        with _cache_lock:
+            entry = _RESULT_CACHE.get(key)
+            if entry is not None and time.monotonic() - entry[0] < _CACHE_TTL:
+                _RESULT_CACHE.move_to_end(key)
+                return copy.deepcopy(entry[1])
+
+    result = _execute_inspector_command(
+        server_command, method, args, tool_arguments, timeout
+    )
+
+    if not (isinstance(result, dict) and result.get("success") is False):
+        with _cache_lock:
+            _RESULT_CACHE[key] = (time.monotonic(), copy.deepcopy(result))
+            _RESULT_CACHE.move_to_end(key)
+            if len(_RESULT_CACHE) > _CACHE_MAX:
+                _RESULT_CACHE.popitem(last=False)
+
+    return result
+
+
+def _execute_inspector_command(
+    server_command: str,
+    method: str,
+    args: tuple[str, ...],
+    tool_arguments: str | None,
+    timeout: int,
+) -> dict[str, Any]:
+    """Run MCP Inspector and parse its output, without caching"""
+    try:
+        # Build the inspector command
+        cmd_parts = [*_inspector_cmd(), "--cli", server_command, *args]
         cmd_parts.extend(["--method", method])
 
         if tool_arguments:
@@ -62,7 +213,7 @@ def _run_inspector_command(
 
         if result.returncode == 0:
             try:
-                return json.loads(result.stdout)
+                return _loads(result.stdout)
             except json.JSONDecodeError:
                 return {
                     "success": True,
@@ -84,7 +235,10 @@ def _run_inspector_command(
 
 
 def inspect_mcp_server(
-    server_command: str, server_args: str = None, timeout: int = 30
+    server_command: str,
+    server_args: str = None,
+    timeout: int = 30,
+    bypass_cache: bool = False,
 ) -> dict[str, Any]:
     """
     Inspect an MCP server to discover its capabilities
@@ -93,15 +247,19 @@ def inspect_mcp_server(
         server_command: Command to start the MCP server (e.g., 'python server.py')
         server_args: Additional arguments for the server command (optional)
         timeout: Timeout in seconds for the inspection (default: 30)
+        bypass_cache: Re-run the inspection even if a recent result is cached (default: False)
 
     Returns:
-        Comprehensive information about the server including tools, resources, and prompts
+        Comprehensive information about the server including tools, resources, and prompts.
+        Results are cached for up to 5 minutes, so changes to the server may not show
+        until bypass_cache is set.
     """
     return _run_inspector_command(
         server_command=server_command,
         method="tools/list",
         server_args=server_args,
         timeout=timeout,
+        bypass_cache=bypass_cache,
     )
 
 
@@ -190,7 +348,10 @@ def get_mcp_prompt(
 
 
 def list_resource_templates(
-    server_command: str, server_args: str = None, timeout: int = 30
+    server_command: str,
+    server_args: str = None,
+    timeout: int = 30,
+    bypass_cache: bool = False,
 ) -> dict[str, Any]:
     """
     List resource templates from an MCP server
@@ -199,18 +360,30 @@ def list_resource_templates(
         server_command: Command to start the MCP server
         server_args: Additional server arguments (optional)
         timeout: Timeout in seconds (default: 30)
+        bypass_cache: Re-run the listing even if a recent result is cached (default: False)
 
     Returns:
-        Available resource templates and their schemas
+        Available resource templates and their schemas. Results are cached for up
+        to 5 minutes, so changes to the server may not show until bypass_cache is set.
     """
     return _run_inspector_command(
         server_command=server_command,
         method="resource_templates/list",
         server_args=server_args,
         timeout=timeout,
+        bypass_cache=bypass_cache,
     )
 
 
+_LEVEL_MAP: Final[dict[str, int]] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+_ROOT_LOGGER: Final = logging.getLogger()
+
+
 def set_logging_level(level: str) -> dict[str, Any]:
     """
     Set logging level for inspector operations
@@ -221,27 +394,24 @@ def set_logging_level(level: str) -> dict[str, Any]:
     Returns:
         Operation result
     """
-    import logging
-
-    level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-    }
-
-    if level.upper() in level_map:
-        logging.getLogger().setLevel(level_map[level.upper()])
-        return {"success": True, "message": f"Logging level set to {level.upper()}"}
-    else:
+    level_int = _LEVEL_MAP.get(level.upper())
+    if level_int is None:
         return {
             "success": False,
             "error": f"Invalid logging level: {level}. Use DEBUG, INFO, WARNING, or ERROR",
         }
 
+    # setLevel clears every logger's level cache, so skip it when nothing changes
+    if _ROOT_LOGGER.level != level_int:
+        _ROOT_LOGGER.setLevel(level_int)
+    return {"success": True, "message": f"Logging level set to {level.upper()}"}
+
 
 def comprehensive_server_test(
-    server_command: str, server_args: str = None, timeout: int = 60
+    server_command: str,
+    server_args: str = None,
+    timeout: int = 60,
+    bypass_cache: bool = False,
 ) -> dict[str, Any]:
     """
     Perform comprehensive testing of an MCP server
@@ -250,30 +420,42 @@ def comprehensive_server_test(
         server_command: Command to start the MCP server
         server_args: Additional server arguments (optional)
         timeout: Timeout in seconds for comprehensive testing (default: 60)
+        bypass_cache: Re-run every probe even if recent results are cached (default: False)
 
     Returns:
-        Detailed test results and summary
+        Detailed test results and summary. Listings are cached for up to 5 minutes,
+        so changes to the server may not show until bypass_cache is set.
     """
     results = {"server_command": server_command, "test_results": {}, "summary": {}}
 
     try:
-        # Test tools listing
-        tools_result = _run_inspector_command(
-            server_command, "tools/list", server_args, timeout=timeout
-        )
-        results["test_results"]["tools_list"] = tools_result
+        # The listings are independent inspector runs, so probe them concurrently;
+        # timeout still applies to each run individually
+        with ThreadPoolExecutor(max_workers=len(_PROBES)) as executor:
+            futures = {
+                key: executor.submit(
+                    _run_inspector_command,
+                    server_command,
+                    method,
+                    server_args,
+                    timeout=timeout,
+                    bypass_cache=bypass_cache,
+                )
+                for key, method in _PROBES
+            }
 
-        # Test resources listing
-        resources_result = _run_inspector_command(
-            server_command, "resources/list", server_args, timeout=timeout
-        )
-        results["test_results"]["resources_list"] = resources_result
+        for key, future in futures.items():
+            try:
+                results["test_results"][key] = future.result()
+            except Exception as e:
+                results["test_results"][key] = {
+                    "success": False,
+                    "error": f"Unexpected error: {str(e)}",
+                }
 
-        # Test prompts listing
-        prompts_result = _run_inspector_command(
-            server_command, "prompts/list", server_args, timeout=timeout
-        )
-        results["test_results"]["prompts_list"] = prompts_result
+        tools_result = results["test_results"]["tools_list"]
+        resources_result = results["test_results"]["resources_list"]
+        prompts_result = results["test_results"]["prompts_list"]
 
         # Generate summary
         results["summary"] = {
@@ -301,17 +483,9 @@ def comprehensive_server_test(
         return results
 
 
-def get_inspector_help(topic: str = None) -> dict[str, Any]:
-    """
-    Get help information about MCP Inspector usage
-
-    Args:
-        topic: Specific help topic (optional)
-
-    Returns:
-        Documentation and usage examples
-    """
-    help_content = {
+def _help_content() -> dict[str, dict[str, Any]]:
+    """Build the inspector help content; every call returns fresh objects"""
+    return {
         "mcp_inspector": {
             "description": "MCP Inspector is a tool for testing and debugging MCP servers",
             "basic_usage": "npx @modelcontextprotocol/inspector --cli <server_command> --method <method>",
@@ -342,26 +516,71 @@ def get_inspector_help(topic: str = None) -> dict[str, Any]:
         },
     }
 
+
+# The topic list and the serialized full response never change, so they are
+# derived once at import; dict responses are built per call
+_HELP_TOPICS: Final = tuple(_help_content())
+_HELP_RESPONSE_JSON: Final = json.dumps(
+    {"success": True, "content": _help_content()}, separators=(",", ":")
+).encode("utf-8")
+
+
+def get_inspector_help(topic: str = None) -> dict[str, Any]:
+    """
+    Get help information about MCP Inspector usage
+
+    Args:
+        topic: Specific help topic (optional)
+
+    Returns:
+        Documentation and usage examples
+    """
     if topic:
         topic_lower = topic.lower()
-        if topic_lower in help_content:
+        if topic_lower in _HELP_TOPICS:
             return {
                 "success": True,
                 "topic": topic,
-                "content": help_content[topic_lower],
+                "content": _help_content()[topic_lower],
             }
         else:
             return {
                 "success": False,
                 "error": f"Help topic '{topic}' not found",
-                "available_topics": list(help_content.keys()),
+                "available_topics": list(_HELP_TOPICS),
             }
     else:
-        return {"success": True, "content": help_content}
+        return {"success": True, "content": _help_content()}
+
+
+def get_inspector_help_bytes() -> bytes:
+    """
+    Get the full inspector help response as UTF-8 encoded JSON
+
+    Same content as get_inspector_help() without a topic, serialized once at
+    import for transports that write JSON directly. Not exported as an MCP
+    tool.
+
+    Returns:
+        bytes: The compact JSON encoding of the full help response
+    """
+    return _HELP_RESPONSE_JSON
+
+
+# Saved inspection configs live next to the tools/ package
+_CONFIG_DIR: Final = Path(__file__).resolve().parent.parent / "inspector_configs"
+
+# os.umask can only be read by setting it, so do that once at import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_CONFIG_FILE_MODE: Final = 0o666 & ~_UMASK
 
 
 def create_inspector_config(
-    server_command: str, config_name: str, server_args: str = None
+    server_command: str,
+    config_name: str,
+    server_args: str = None,
+    pretty: bool = True,
 ) -> dict[str, Any]:
     """
     Create a configuration file for repeated inspections
@@ -370,6 +589,7 @@ def create_inspector_config(
         server_command: Command to start the MCP server
         config_name: Name for the configuration
         server_args: Additional server arguments (optional)
+        pretty: Indent the saved JSON for readability (default: True)
 
     Returns:
         Configuration creation result
@@ -378,18 +598,33 @@ def create_inspector_config(
         "name": config_name,
         "server_command": server_command,
         "server_args": server_args,
-        "created_at": str(
-            Path(__file__).parent.parent / "inspector_configs" / f"{config_name}.json"
-        ),
+        "created_at": datetime.now(timezone.utc).isoformat(),
     }
 
     try:
-        config_dir = Path(__file__).parent.parent / "inspector_configs"
-        config_dir.mkdir(exist_ok=True)
+        _CONFIG_DIR.mkdir(exist_ok=True)
+
+        config_file = _CONFIG_DIR / f"{config_name}.json"
+        if pretty:
+            payload = json.dumps(config, indent=2)
+        else:
+            payload = json.dumps(config, separators=(",", ":"))
 
-        config_file = config_dir / f"{config_name}.json"
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        # Write to a uniquely named temporary file and rename it into place, so
+        # inspect_with_config never reads a half-written config, even when the
+        # same config is saved concurrently
+        fd, tmp_name = tempfile.mkstemp(
+            dir=config_file.parent, prefix=f".{config_file.stem}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload.encode("utf-8"))
+            # mkstemp creates the file owner-only; give it the mode open() would
+            os.chmod(tmp_name, _CONFIG_FILE_MODE)
+            os.replace(tmp_name, config_file)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
 
         return {
             "success": True,
@@ -401,46 +636,90 @@ def create_inspector_config(
         return {"success": False, "error": f"Failed to save configuration: {str(e)}"}
 
 
-def batch_inspect_servers(server_configs: str, timeout: int = 30) -> dict[str, Any]:
+def _batch_server_key(index: int, config: dict) -> tuple:
+    """Identify the server a batch entry targets, so duplicates share a run"""
+    server_args = config.get("args")
+    if isinstance(server_args, list) and all(
+        isinstance(arg, str) for arg in server_args
+    ):
+        args_key = tuple(server_args)
+    elif server_args is None or isinstance(server_args, str):
+        try:
+            args_key = _split_args(server_args)
+        except ValueError:
+            args_key = None
+    else:
+        args_key = None
+
+    if args_key is None or not isinstance(config["command"], str):
+        # Not deduplicated; _run_inspector_command reports the entry's error
+        return ("__raw__", index)
+    return (config["command"], args_key)
+
+
+def batch_inspect_servers(
+    server_configs: str | list[dict[str, Any]],
+    timeout: int = 30,
+    bypass_cache: bool = False,
+) -> dict[str, Any]:
     """
     Inspect multiple MCP servers in batch
 
     Args:
-        server_configs: JSON string containing array of server configurations
+        server_configs: Array of server configurations, as a list or a JSON string
         timeout: Timeout per server in seconds (default: 30)
+        bypass_cache: Re-inspect every server even if recent results are cached (default: False)
 
     Returns:
-        Aggregated results from multiple servers
+        Aggregated results from multiple servers. Results are cached for up to
+        5 minutes, so changes to a server may not show until bypass_cache is set.
     """
     try:
-        configs = json.loads(server_configs)
+        configs = (
+            server_configs
+            if isinstance(server_configs, list)
+            else _loads(server_configs)
+        )
         results = {
             "batch_results": [],
             "summary": {"total_servers": len(configs), "successful": 0, "failed": 0},
         }
 
+        # Entries naming the same server and arguments share a single inspection
+        servers: dict[tuple, list[int]] = {}
         for i, config in enumerate(configs):
-            server_command = config.get("command")
-            server_args = config.get("args")
+            if config.get("command"):
+                servers.setdefault(_batch_server_key(i, config), []).append(i)
+
+        # Each server runs in its own inspector process, so inspect them concurrently
+        max_workers = max(1, min(len(servers), (os.cpu_count() or 1) * 4))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            inspected = executor.map(
+                lambda indices: _run_inspector_command(
+                    server_command=configs[indices[0]]["command"],
+                    method="tools/list",
+                    server_args=configs[indices[0]].get("args"),
+                    timeout=timeout,
+                    bypass_cache=bypass_cache,
+                ),
+                servers.values(),
+            )
+            server_results = {
+                i: result
+                for indices, result in zip(servers.values(), inspected)
+                for i in indices
+            }
 
-            if not server_command:
+        for i, config in enumerate(configs):
+            if i in server_results:
+                result = {"index": i, "config": config, **server_results[i]}
+            else:
                 result = {
                     "index": i,
                     "config": config,
                     "success": False,
                     "error": "Missing server command",
                 }
-            else:
-                result = {
-                    "index": i,
-                    "config": config,
-                    **_run_inspector_command(
-                        server_command=server_command,
-                        method="tools/list",
-                        server_args=server_args,
-                        timeout=timeout,
-                    ),
-                }
 
             results["batch_results"].append(result)
 
@@ -457,16 +736,31 @@ def batch_inspect_servers(server_configs: str, timeout: int = 30) -> dict[str, A
         return {"success": False, "error": f"Batch inspection failed: {str(e)}"}
 
 
-def inspect_with_config(config_file: str, timeout: int = 30) -> dict[str, Any]:
+@lru_cache(maxsize=64)
+def _load_config(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Parse a saved inspection config
+
+    Keyed on the file's modification time and size as well as its path, so
+    repeat inspections reuse the parsed config until the file is rewritten.
+    """
+    return _loads(Path(path).read_bytes())
+
+
+def inspect_with_config(
+    config_file: str, timeout: int = 30, bypass_cache: bool = False
+) -> dict[str, Any]:
     """
     Inspect a server using a saved configuration file
 
     Args:
         config_file: Path to the configuration file
         timeout: Timeout in seconds (default: 30)
+        bypass_cache: Re-run the inspection even if a recent result is cached (default: False)
 
     Returns:
-        Inspection result using saved configuration
+        Inspection result using saved configuration. Results are cached for up to
+        5 minutes, so changes to the server may not show until bypass_cache is set.
     """
     try:
         config_path = Path(config_file)
@@ -476,8 +770,10 @@ def inspect_with_config(config_file: str, timeout: int = 30) -> dict[str, Any]:
                 "error": f"Configuration file not found: {config_file}",
             }
 
-        with open(config_path, encoding="utf-8") as f:
-            config = json.load(f)
+        stat = config_path.stat()
+        config = copy.deepcopy(
+            _load_config(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        )
 
         server_command = config.get("server_command")
         server_args = config.get("server_args")
@@ -493,6 +789,7 @@ def inspect_with_config(config_file: str, timeout: int = 30) -> dict[str, Any]:
             method="tools/list",
             server_args=server_args,
             timeout=timeout,
+            bypass_cache=bypass_cache,
         )
 
         result["config_used"] = config